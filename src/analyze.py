@@ -35,7 +35,7 @@ def strip_json_fences(text: str) -> str:
     return text
 
 
-@config.retry()
+@config.retry(max_attempts=4, base_delay=5.0, max_delay=60.0)
 def analyze_photo(
     jpeg_path: Path,
     folder_hint: str,
@@ -10,13 +10,16 @@ CLI:
     python -m src.catalog scan       # discover new files on disk
 """
 
-import json
 import logging
+import os
 import sqlite3
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+from pydantic_core import from_json
+
 from . import config
 
 log = logging.getLogger(__name__)
@@ -24,6 +27,9 @@ log = logging.getLogger(__name__)
 PHOTO_EXTENSIONS = {".tif", ".tiff", ".jpg", ".jpeg", ".png"}
 DOCUMENT_EXTENSIONS = {".pdf"}
 
+# Concurrent file hashes when scanning new or changed files
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
 
 # ---------------------------------------------------------------------------
 # Schema + init
@@ -174,8 +180,8 @@ def backfill_from_manifests(
 
         for mf in sorted(manifests_dir.glob("*.json")):
             try:
-                data = json.loads(mf.read_text())
-            except (json.JSONDecodeError, OSError) as e:
+                data = from_json(mf.read_bytes())
+            except (ValueError, OSError) as e:
                 log.warning("Skipping %s: %s", mf, e)
                 continue
 
@@ -216,42 +222,42 @@ def scan_directory(conn: sqlite3.Connection, directory: Path, content_type: str,
     Returns {"new": N, "stale": N, "unchanged": N}.
     """
     from .convert import sha256_file
+    from .scan_cache import find_files
 
     base = base_path or directory.parent
     result = {"new": 0, "stale": 0, "unchanged": 0}
 
-    for f in sorted(directory.rglob("*")):
-        if not f.is_file():
-            continue
-        if f.suffix.lower() not in extensions:
-            continue
-        if f.name.startswith("."):
-            continue
-
+    # First pass: settle unchanged files from stat alone, queue the rest.
+    to_hash = []
+    for f, stat in find_files(directory, extensions):
         rel_path = str(f.relative_to(base))
-        stat = f.stat()
-        file_size = stat.st_size
-        file_mtime = stat.st_mtime
-
         existing = conn.execute(
             "SELECT sha256, file_size, file_mtime, status, manifest_path FROM assets WHERE path=?",
             (rel_path,),
         ).fetchone()
+        if (existing
+                and existing["file_size"] == stat.st_size
+                and existing["file_mtime"] == stat.st_mtime):
+            result["unchanged"] += 1
+            continue
+        to_hash.append((f, stat, rel_path, existing))
 
-        if existing:
-            if (existing["file_size"] == file_size
-                    and existing["file_mtime"] == file_mtime):
-                result["unchanged"] += 1
-                continue
-            sha = sha256_file(f)
-            if sha == existing["sha256"]:
+    if not to_hash:
+        return result
+
+    # file_digest releases the GIL, so threads hash on separate cores and
+    # keep several NAS reads in flight; catalog writes stay on this thread.
+    with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(to_hash))) as pool:
+        hashes = pool.map(lambda item: sha256_file(item[0]), to_hash)
+        for (f, stat, rel_path, existing), sha in zip(to_hash, hashes):
+            if existing and sha == existing["sha256"]:
                 upsert_asset(
                     conn,
                     sha256=sha,
                     path=rel_path,
                     content_type=content_type,
-                    file_size=file_size,
-                    file_mtime=file_mtime,
+                    file_size=stat.st_size,
+                    file_mtime=stat.st_mtime,
                     status=existing["status"],
                     manifest_path=existing["manifest_path"],
                 )
@@ -262,23 +268,11 @@ def scan_directory(conn: sqlite3.Connection, directory: Path, content_type: str,
                     sha256=sha,
                     path=rel_path,
                     content_type=content_type,
-                    file_size=file_size,
-                    file_mtime=file_mtime,
+                    file_size=stat.st_size,
+                    file_mtime=stat.st_mtime,
                     status="discovered",
                 )
-                result["stale"] += 1
-        else:
-            sha = sha256_file(f)
-            upsert_asset(
-                conn,
-                sha256=sha,
-                path=rel_path,
-                content_type=content_type,
-                file_size=file_size,
-                file_mtime=file_mtime,
-                status="discovered",
-            )
-            result["new"] += 1
+                result["stale" if existing else "new"] += 1
 
     return result
 
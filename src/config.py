@@ -3,6 +3,7 @@
 import functools
 import logging
 import os
+import random
 import time as _time
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
@@ -96,6 +97,8 @@ DOC_PROMPT_FILE = REPO_ROOT / "prompts" / f"{DOC_PROMPT_VERSION}.txt"
 # --- Batch / pacing controls ---
 DOC_BATCH_SIZE = int(os.environ.get("DOC_BATCH_SIZE", "0"))        # 0 = unlimited
 DOC_PACING_DELAY = float(os.environ.get("DOC_PACING_DELAY", "0"))  # seconds between docs
+DOC_WORKERS = int(os.environ.get("DOC_WORKERS", "1"))             # concurrent documents
+PHOTO_WORKERS = int(os.environ.get("PHOTO_WORKERS", "1"))         # concurrent photo analyses
 
 # --- Immich confidence thresholds ---
 CONFIDENCE_HIGH = 0.8
@@ -198,19 +201,32 @@ def _get_retryable_exceptions() -> tuple[type[Exception], ...]:
     return _RETRYABLE_EXCEPTIONS
 
 
+_RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 529)
+
+
 def _is_retryable_status(exc: Exception) -> bool:
-    """Check if an HTTP status error has a retryable status code."""
+    """Check if an HTTP or Anthropic API status error has a retryable status code."""
     import httpx
+    import anthropic
     if isinstance(exc, httpx.HTTPStatusError):
-        return exc.response.status_code in (429, 500, 502, 503)
+        return exc.response.status_code in _RETRYABLE_STATUS_CODES
+    if isinstance(exc, anthropic.APIStatusError):
+        return exc.status_code in _RETRYABLE_STATUS_CODES
     return False
 
 
+def is_transient_error(exc: Exception) -> bool:
+    """True if exc is the kind of error @retry retries (network, rate limit, 5xx)."""
+    return isinstance(exc, _get_retryable_exceptions()) or _is_retryable_status(exc)
+
+
 def retry(max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 30.0):
     """Decorator for exponential-backoff retry on transient errors.
 
     Retries on: connection errors, timeouts, rate limits, 429/5xx.
     Does NOT retry on: 400/401/403 (config errors).
+    Delays are jittered (50-100% of the backoff) so concurrent workers
+    that hit the same rate limit don't retry in lockstep.
     """
     _log = logging.getLogger("living_archive")
 
@@ -231,6 +247,7 @@ def retry(max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 30.
                         raise
                 if attempt < max_attempts:
                     delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+                    delay = random.uniform(delay / 2, delay)
                     _log.warning(
                         "Retry %d/%d for %s after %.1fs: %s",
                         attempt, max_attempts, fn.__name__, delay, last_exc,
@@ -1,45 +1,83 @@
 """Photo preparation (TIFF/JPEG → analysis-ready JPEG) and SHA-256 hashing."""
 
 import hashlib
+import io
+import os
+import re
 from pathlib import Path
+from typing import BinaryIO
 
 from PIL import Image
 
-MAX_EDGE = 2048
+# Claude downscales anything past ~1568px on the long edge before the model
+# sees it; sending more only adds upload bytes and billed input tokens.
+MAX_EDGE = 1568
 JPEG_QUALITY = 85
 MAX_ANALYSIS_BYTES = 5 * 1024 * 1024
+PHOTO_SUFFIXES = (".tif", ".tiff", ".jpg", ".jpeg")
+
+_EMBEDDED_SHA256 = re.compile(r"(?<![0-9a-f])[0-9a-f]{64}(?![0-9a-f])", re.IGNORECASE)
 
 
 def sha256_file(path: Path) -> str:
     """Compute SHA-256 hex digest of a file."""
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1 << 20), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 
+def embedded_sha256(path: Path) -> str | None:
+    """Return a SHA-256 hex digest embedded in the file name, if there is one.
+
+    Download tools often name files <sha256>.pdf; trusting that name skips
+    reading the whole file just to hash it.
+    """
+    m = _EMBEDDED_SHA256.search(path.stem)
+    return m.group(0).lower() if m else None
 
-def prepare_for_analysis(src: Path, dst: Path) -> None:
-    """Convert a photo to JPEG, resizing so the longest edge <= MAX_EDGE."""
+
+def prepare_for_analysis(src: Path | BinaryIO, dst: Path) -> None:
+    """Convert a photo to JPEG, resizing so the longest edge <= MAX_EDGE.
+
+    src may be a path or any seekable binary file object Pillow can read.
+    """
     with Image.open(src) as img:
-        img = img.convert("RGB")
         w, h = img.size
         if max(w, h) > MAX_EDGE:
-            scale = MAX_EDGE / max(w, h)
-            img = img.resize(
-                (int(w * scale), int(h * scale)), Image.Resampling.LANCZOS
-            )
+            target = (int(w * MAX_EDGE / max(w, h)), int(h * MAX_EDGE / max(w, h)))
+            # JPEGs can be decoded at 1/2, 1/4 or 1/8 scale in libjpeg-turbo's
+            # DCT; draft picks the smallest scale that still covers target.
+            img.draft("RGB", target)
+            img = img.convert("RGB").resize(target, Image.Resampling.LANCZOS)
+        else:
+            img = img.convert("RGB")
         dst.parent.mkdir(parents=True, exist_ok=True)
         img.save(dst, "JPEG", quality=JPEG_QUALITY)
 
 
+def hash_and_prepare(src: Path, dst: Path) -> str:
+    """Hash src and write its analysis JPEG to dst from one read of the file.
+
+    The bytes are read into memory once and shared by the hasher and Pillow
+    instead of pulling a large scan over the NAS twice. A plain read (not
+    mmap) keeps NAS I/O errors and truncated files as catchable OSErrors
+    rather than SIGBUS. Returns the SHA-256.
+    """
+    with open(src, "rb") as f:
+        data = f.read()
+    sha = hashlib.sha256(data).hexdigest()
+    prepare_for_analysis(io.BytesIO(data), dst)
+    return sha
+
+
+def is_photo_entry(entry: os.DirEntry) -> bool:
+    """True for a TIFF/JPEG file, judged from its directory entry."""
+    return entry.name.lower().endswith(PHOTO_SUFFIXES) and entry.is_file()
+
+
 def find_photos(directory: Path) -> list[Path]:
     """Find all TIFF and JPEG files in a directory (non-recursive)."""
-    photos = []
-    for ext in ("*.tiff", "*.tif", "*.TIFF", "*.TIF",
-                "*.jpg", "*.jpeg", "*.JPG", "*.JPEG"):
-        photos.extend(directory.glob(ext))
-    return sorted(photos)
+    with os.scandir(directory) as it:
+        return sorted(Path(entry.path) for entry in it if is_photo_entry(entry))
 
 
 def needs_conversion(path: Path) -> bool:
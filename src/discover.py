@@ -2,11 +2,12 @@
 
 import fnmatch
 import logging
+import os
 from pathlib import Path
 
 from . import config
 from .catalog import PHOTO_EXTENSIONS, get_catalog_db, init_catalog
-from .convert import find_photos
+from .convert import find_photos, is_photo_entry
 
 log = logging.getLogger(__name__)
 
@@ -16,18 +17,26 @@ EXCLUDE_PATTERNS = ["Unsorted Archival", "_ai-layer", "/TIFF/", "/TiIF/"]
 def find_photo_dirs(root: Path) -> list[Path]:
     """Walk root for leaf directories containing TIFF/JPEG files.
 
-    Skips directories matching EXCLUDE_PATTERNS.
+    Skips directories matching EXCLUDE_PATTERNS. Each directory is listed
+    once with os.scandir, which yields both its subdirectories and whether
+    it holds photos without a stat per entry. Like Path.rglob, symlinked
+    directories are not descended into and unreadable ones are skipped.
     """
     dirs = []
-    for dirpath in sorted(root.rglob("*")):
-        if not dirpath.is_dir():
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except PermissionError as e:
+            log.warning("Skipping unreadable directory %s: %s", current, e)
             continue
-        if any(pat in str(dirpath) for pat in EXCLUDE_PATTERNS):
-            continue
-        photos = find_photos(dirpath)
-        if photos:
-            dirs.append(dirpath)
-    return dirs
+        has_photos = any(is_photo_entry(e) for e in entries)
+        if current is not root and has_photos and not any(pat in str(current) for pat in EXCLUDE_PATTERNS):
+            dirs.append(current)
+        stack.extend(Path(e.path) for e in entries if e.is_dir(follow_symlinks=False))
+    return sorted(dirs)
 
 
 def build_batch_work_list(root: Path) -> list[dict]:
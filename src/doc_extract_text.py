@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 from pypdf import PdfReader
@@ -24,12 +25,12 @@ class ExtractionResult:
     page_texts: list[str] = field(default_factory=list)
     chars_extracted: int = 0
 
-    @property
+    @cached_property
     def full_text(self) -> str:
-        parts = []
-        for i, text in enumerate(self.page_texts, 1):
-            parts.append(f"--- Page {i} ---\n{text}")
-        return "\n\n".join(parts)
+        """Page texts joined with page markers, built once per result."""
+        return "\n\n".join(
+            f"--- Page {i} ---\n{text}" for i, text in enumerate(self.page_texts, 1)
+        )
 
     @property
     def is_empty(self) -> bool:
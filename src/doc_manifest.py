@@ -1,15 +1,23 @@
 """Read/write document manifest JSON files to the AI layer."""
 
-import json
 import logging
+import os
 import tempfile
+import threading
+from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+from pydantic_core import from_json, to_json
+
 from . import config
+from .scan_cache import cached_entry, load_scan_cache, save_scan_cache, store_entry
 
 log = logging.getLogger(__name__)
 
+_index_lock = threading.Lock()
+
 
 def run_dir(run_id: str) -> Path:
     """Return the manifests directory for a given run."""
@@ -21,6 +29,11 @@ def text_dir(run_id: str) -> Path:
     return config.DOC_AI_LAYER_DIR / "runs" / run_id / "extracted-text"
 
 
+def processed_index_path(run_id: str) -> Path:
+    """Return the processed-hashes index file for a given run."""
+    return config.DOC_AI_LAYER_DIR / "runs" / run_id / "processed_hashes.txt"
+
+
 def write_manifest(
     run_id: str,
     source_file_rel: str,
@@ -63,13 +76,20 @@ def write_manifest(
     # Atomic write: temp file + rename
     fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
     try:
-        with open(fd, "w") as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        with open(fd, "wb") as f:
+            f.write(to_json(manifest, indent=2))
         Path(tmp).rename(out_path)
     except BaseException:
         Path(tmp).unlink(missing_ok=True)
         raise
 
+    # Keep the processed-hashes index current once get_processed_hashes has built it
+    index_path = processed_index_path(run_id)
+    with _index_lock:
+        if index_path.exists():
+            with open(index_path, "a") as f:
+                f.write(source_sha256 + "\n")
+
     # Update catalog (non-fatal — catalog is optional)
     try:
         from .catalog import get_catalog_db, init_catalog, upsert_asset
@@ -155,13 +175,23 @@ def write_run_meta(
     out_dir = config.DOC_AI_LAYER_DIR / "runs" / run_id
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "run_meta.json"
-    out_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False))
+    out_path.write_bytes(to_json(meta, indent=2))
     return out_path
 
 
 def load_manifest(path: Path) -> dict:
-    """Load a manifest JSON file."""
-    return json.loads(path.read_text())
+    """Load a manifest JSON file.
+
+    Parsed dicts are cached by (path, mtime, size), so an edited file is
+    re-read automatically. Treat the returned dict as read-only.
+    """
+    st = os.stat(path)
+    return _load_manifest_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=2048)
+def _load_manifest_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    return from_json(Path(path_str).read_bytes())
 
 
 def list_manifests(run_id: str) -> list[Path]:
@@ -173,9 +203,74 @@ def list_manifests(run_id: str) -> list[Path]:
 
 
 def get_processed_hashes(run_id: str) -> set[str]:
-    """Return set of SHA-256 hashes already processed in a run."""
+    """Return set of SHA-256 hashes already processed in a run.
+
+    Reads runs/{run_id}/processed_hashes.txt, which write_manifest appends
+    to. The index is trusted only while it names exactly the manifest files
+    on disk, checked against a directory listing rather than mtimes (which
+    are too coarse on SMB/HFS+ to notice a deletion). Otherwise it is rebuilt
+    from the manifests.
+    """
+    index_path = processed_index_path(run_id)
+    d = run_dir(run_id)
+    manifests = list_manifests(run_id)
+    try:
+        indexed = set(index_path.read_text().split())
+    except FileNotFoundError:
+        pass
+    else:
+        if {f"{h[:12]}.json" for h in indexed} == {p.name for p in manifests}:
+            return indexed
+
     hashes = set()
-    for manifest_path in list_manifests(run_id):
+    for manifest_path in manifests:
         data = load_manifest(manifest_path)
         hashes.add(data["source_sha256"])
+    if d.exists():
+        with _index_lock:
+            fd, tmp = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+            try:
+                with open(fd, "w") as f:
+                    f.write("".join(h + "\n" for h in sorted(hashes)))
+                Path(tmp).rename(index_path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
     return hashes
+
+
+def status_summary(run_id: str) -> dict:
+    """Aggregate page and document-type counts across a run's manifests.
+
+    Per-manifest fields are kept in runs/{run_id}/status_summary.json and
+    trusted while a manifest's size and mtime match, so repeat status calls
+    only parse manifests written since the last one.
+    """
+    summary_path = config.DOC_AI_LAYER_DIR / "runs" / run_id / "status_summary.json"
+    cached = load_scan_cache(summary_path)
+    entries: dict[str, dict] = {}
+    dirty = False
+    for mp in list_manifests(run_id):
+        st = mp.stat()
+        entry = cached_entry(cached, mp.name, st)
+        if entry is None:
+            data = load_manifest(mp)
+            try:
+                doc_type = data["analysis"]["document_type"]
+            except KeyError:
+                doc_type = "unknown"
+            entry = store_entry(
+                entries, mp.name, st,
+                page_count=data.get("page_count", 0),
+                document_type=doc_type,
+            )
+            dirty = True
+        entries[mp.name] = entry
+    if dirty or len(entries) != len(cached):
+        save_scan_cache(summary_path, entries)
+
+    return {
+        "manifests": len(entries),
+        "total_pages": sum(e["page_count"] for e in entries.values()),
+        "doc_types": Counter(e["document_type"] for e in entries.values()),
+    }
@@ -1,19 +1,42 @@
 """Immich REST API client for asset updates and album management."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
 import httpx
 
 from . import config
 from .config import retry
 
 TIMEOUT = 30.0
+UPDATE_WORKERS = 8  # concurrent PUT /assets requests during bulk updates
+STATS_WORKERS = 16  # concurrent GET /people/{id}/statistics requests
+
+
+_shared_client: httpx.Client | None = None
+_shared_client_lock = threading.Lock()
 
 
 def _client() -> httpx.Client:
-    return httpx.Client(
-        base_url=config.IMMICH_URL.rstrip("/") + "/api",
-        headers={"x-api-key": config.IMMICH_API_KEY},
-        timeout=TIMEOUT,
-    )
+    """Return the process-wide Immich client, creating it on first use.
+
+    Sharing one client keeps its connection pool warm across slices and
+    sync commands instead of reconnecting for every push.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = httpx.Client(
+                base_url=config.IMMICH_URL.rstrip("/") + "/api",
+                headers={"x-api-key": config.IMMICH_API_KEY},
+                timeout=TIMEOUT,
+                limits=httpx.Limits(
+                    max_keepalive_connections=max(UPDATE_WORKERS, STATS_WORKERS),
+                    keepalive_expiry=300,
+                ),
+            )
+        return _shared_client
 
 
 @retry()
@@ -42,11 +65,32 @@ def search_assets_by_path(client: httpx.Client, path_prefix: str) -> list[dict]:
     return assets
 
 
-def build_path_lookup(assets: list[dict]) -> dict[str, str]:
-    """Build a mapping from originalPath -> assetId."""
-    return {asset.get("originalPath", ""): asset["id"] for asset in assets}
+def build_name_lookup(assets: list[dict]) -> dict[str, str]:
+    """Build a mapping from file name (last originalPath segment) -> assetId.
+
+    When several assets share a name, the first one returned by Immich wins.
+    """
+    lookup: dict[str, str] = {}
+    for asset in assets:
+        name = asset.get("originalPath", "").rsplit("/", 1)[-1]
+        lookup.setdefault(name, asset["id"])
+    return lookup
+
+
+def _asset_update_body(
+    asset_ids: list[str],
+    date_time_original: str | None,
+    description: str | None,
+) -> dict:
+    body: dict = {"ids": asset_ids}
+    if date_time_original:
+        body["dateTimeOriginal"] = date_time_original
+    if description:
+        body["description"] = description
+    return body
 
 
+# Single-asset form of update_assets_bulk; still used by _dev/migrate_metadata.py
 @retry()
 def update_asset(
     client: httpx.Client,
@@ -55,15 +99,61 @@ def update_asset(
     description: str | None = None,
 ) -> None:
     """Update an asset's metadata via PUT /assets."""
-    body: dict = {"ids": [asset_id]}
-    if date_time_original:
-        body["dateTimeOriginal"] = date_time_original
-    if description:
-        body["description"] = description
-    resp = client.put("/assets", json=body)
+    resp = client.put(
+        "/assets", json=_asset_update_body([asset_id], date_time_original, description)
+    )
+    resp.raise_for_status()
+
+
+@retry()
+def _update_asset_group(
+    client: httpx.Client,
+    asset_ids: list[str],
+    date_time_original: str | None,
+    description: str | None,
+) -> None:
+    resp = client.put(
+        "/assets", json=_asset_update_body(asset_ids, date_time_original, description)
+    )
     resp.raise_for_status()
 
 
+def update_assets_bulk(
+    client: httpx.Client,
+    updates: list[tuple[str, str | None, str | None]],
+    max_workers: int = UPDATE_WORKERS,
+) -> dict[str, Exception]:
+    """Apply (asset_id, date_time_original, description) updates in bulk.
+
+    PUT /assets takes a list of ids, so assets sharing identical values are
+    sent as one request. The remaining distinct requests are dispatched
+    concurrently over the shared client instead of one round-trip at a time.
+    An asset listed more than once keeps only its last update, so no two
+    concurrent requests touch the same asset.
+
+    Returns {asset_id: exception} for every asset whose update failed.
+    """
+    latest = {asset_id: (date, desc) for asset_id, date, desc in updates}
+    groups: dict[tuple[str | None, str | None], list[str]] = {}
+    for asset_id, values in latest.items():
+        groups.setdefault(values, []).append(asset_id)
+
+    failures: dict[str, Exception] = {}
+    if not groups:
+        return failures
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+        futures = {
+            pool.submit(_update_asset_group, client, ids, date, desc): ids
+            for (date, desc), ids in groups.items()
+        }
+        for future in as_completed(futures):
+            exc = future.exception()
+            if exc is not None:
+                for asset_id in futures[future]:
+                    failures[asset_id] = exc
+    return failures
+
+
 @retry()
 def create_album(
     client: httpx.Client,
@@ -110,6 +200,23 @@ def get_person_statistics(client: httpx.Client, person_id: str) -> dict:
     return resp.json()
 
 
+def get_people_statistics(
+    client: httpx.Client,
+    person_ids: list[str],
+    max_workers: int = STATS_WORKERS,
+) -> dict[str, dict]:
+    """Fetch statistics for many person clusters concurrently.
+
+    Immich has no bulk statistics endpoint, so the per-person GETs are
+    fanned out over the shared client. Returns {person_id: stats}.
+    """
+    if not person_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(person_ids))) as pool:
+        stats = pool.map(lambda pid: get_person_statistics(client, pid), person_ids)
+        return dict(zip(person_ids, stats))
+
+
 @retry()
 def update_person(
     client: httpx.Client,
@@ -128,6 +235,7 @@ def update_person(
     return resp.json()
 
 
+@lru_cache(maxsize=1024)
 def date_estimate_to_iso(date_str: str) -> str:
     """Convert a date estimate like '1978-06' or '1978' to ISO datetime.
 
@@ -1,11 +1,14 @@
 """Read/write manifest JSON files to the AI layer."""
 
-import json
 import logging
+import os
 import tempfile
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+from pydantic_core import from_json, to_json
+
 from . import config
 from .models import InferenceMetadata, PhotoAnalysis, PhotoManifest
 
@@ -28,15 +31,16 @@ def write_manifest(
 
     Returns the path to the written file.
     """
-    manifest = {
-        "source_file": source_file_rel,
-        "source_sha256": source_sha256,
-        "analysis": analysis.model_dump(),
-        "inference": {
-            **inference.model_dump(),
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        },
-    }
+    # Build the model from the already-validated parts and serialize it in
+    # one pass, rather than model_dump() -> dict -> json.dump.
+    manifest = PhotoManifest(
+        source_file=source_file_rel,
+        source_sha256=source_sha256,
+        analysis=analysis,
+        inference=inference.model_copy(
+            update={"timestamp": datetime.now(timezone.utc).isoformat()}
+        ),
+    )
 
     out_dir = run_dir(run_id)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -47,8 +51,8 @@ def write_manifest(
     # Atomic write: temp file + rename
     fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
     try:
-        with open(fd, "w") as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        with open(fd, "wb") as f:
+            f.write(to_json(manifest, indent=2))
         Path(tmp).rename(out_path)
     except BaseException:
         Path(tmp).unlink(missing_ok=True)
@@ -109,7 +113,7 @@ def write_run_meta(
     out_dir = config.AI_LAYER_DIR / "runs" / run_id
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "run_meta.json"
-    out_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False))
+    out_path.write_bytes(to_json(meta, indent=2))
     return out_path
 
 
@@ -117,21 +121,32 @@ def load_manifest(path: Path) -> PhotoManifest:
     """Load a manifest JSON file as a PhotoManifest model.
 
     Falls back to raw dict parsing with a warning for incompatible manifests.
+    Parsed models are cached by (path, mtime, size), so an edited file is
+    re-read automatically. Treat the returned model as read-only.
     """
-    data = json.loads(path.read_text())
+    st = os.stat(path)
+    return _load_manifest_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=2048)
+def _load_manifest_cached(path_str: str, mtime_ns: int, size: int) -> PhotoManifest:
+    path = Path(path_str)
+    raw = path.read_bytes()
     try:
-        return PhotoManifest.model_validate(data)
+        return PhotoManifest.model_validate_json(raw)
     except Exception:
         log.warning("Failed to validate manifest %s, loading with defaults", path.name)
-        return PhotoManifest.model_validate(data)
+        return PhotoManifest.model_validate(from_json(raw))
 
 
 def update_manifest(run_id: str, sha: str, updates: dict) -> Path:
     """Merge updates into an existing manifest JSON file."""
     path = run_dir(run_id) / f"{sha}.json"
-    data = json.loads(path.read_text())
+    data = from_json(path.read_bytes())
     data.update(updates)
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+    path.write_bytes(to_json(data, indent=2))
+    # mtime granularity can be coarser than back-to-back writes
+    _load_manifest_cached.cache_clear()
     return path
 
 
@@ -141,3 +156,26 @@ def list_manifests(run_id: str) -> list[Path]:
     if not d.exists():
         return []
     return sorted(d.glob("*.json"))
+
+
+def processed_manifest_names() -> set[str]:
+    """Return the manifest filenames present in any photo run.
+
+    One scandir pass per run directory, so callers can test "already
+    processed?" with a set lookup instead of stat-ing every run per photo.
+    """
+    names: set[str] = set()
+    try:
+        runs = os.scandir(config.AI_LAYER_DIR / "runs")
+    except FileNotFoundError:
+        return names
+    with runs:
+        for run in runs:
+            if not run.is_dir():
+                continue
+            try:
+                with os.scandir(os.path.join(run.path, "manifests")) as entries:
+                    names.update(e.name for e in entries if e.name.endswith(".json"))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+    return names
@@ -1,10 +1,11 @@
 """People registry: durable identity store independent of Immich."""
 
-import json
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
+from pydantic_core import to_json
+
 from . import config
 from .models import PeopleRegistry, Person
 
@@ -16,20 +17,27 @@ def load_registry() -> PeopleRegistry:
     """Load the people registry from disk. Returns empty registry if missing."""
     if not REGISTRY_PATH.exists():
         return PeopleRegistry()
-    return PeopleRegistry.model_validate(json.loads(REGISTRY_PATH.read_text()))
+    return PeopleRegistry.model_validate_json(REGISTRY_PATH.read_bytes())
 
 
 def save_registry(registry: PeopleRegistry) -> Path:
     """Atomically write the people registry to disk."""
     PEOPLE_DIR.mkdir(parents=True, exist_ok=True)
     tmp = REGISTRY_PATH.with_suffix(".tmp")
-    tmp.write_text(json.dumps(registry.model_dump(), indent=2, ensure_ascii=False))
+    tmp.write_bytes(to_json(registry, indent=2))
     tmp.rename(REGISTRY_PATH)
     return REGISTRY_PATH
 
 
-def add_person(
-    registry: PeopleRegistry,
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    return datetime.now(_UTC).isoformat()
+
+
+def _new_person(
+    now: str,
     name_en: str,
     name_zh: str = "",
     relationship: str = "",
@@ -37,9 +45,7 @@ def add_person(
     notes: str = "",
     immich_person_ids: list[str] | None = None,
 ) -> Person:
-    """Add a new person to the registry. Returns the created Person."""
-    now = datetime.now(timezone.utc).isoformat()
-    person = Person(
+    return Person(
         person_id=str(uuid.uuid4()),
         name_en=name_en,
         name_zh=name_zh,
@@ -50,15 +56,38 @@ def add_person(
         created_at=now,
         updated_at=now,
     )
+
+
+def add_person(
+    registry: PeopleRegistry,
+    name_en: str,
+    name_zh: str = "",
+    relationship: str = "",
+    birth_year: int | None = None,
+    notes: str = "",
+    immich_person_ids: list[str] | None = None,
+) -> Person:
+    """Add a new person to the registry. Returns the created Person."""
+    person = _new_person(
+        _now_iso(),
+        name_en=name_en,
+        name_zh=name_zh,
+        relationship=relationship,
+        birth_year=birth_year,
+        notes=notes,
+        immich_person_ids=immich_person_ids,
+    )
     registry.people.append(person)
     return person
 
 
-def find_person_by_immich_id(
-    registry: PeopleRegistry, immich_person_id: str
-) -> Person | None:
-    """Find a person by their linked Immich face cluster ID."""
-    for person in registry.people:
-        if immich_person_id in person.immich_person_ids:
-            return person
-    return None
+def add_people_bulk(registry: PeopleRegistry, entries: list[dict]) -> list[Person]:
+    """Add several people at once. Returns the created Persons in order.
+
+    Each entry holds add_person keyword arguments. All rows share one
+    created_at/updated_at timestamp.
+    """
+    now = _now_iso()
+    people = [_new_person(now, **entry) for entry in entries]
+    registry.people.extend(people)
+    return people
@@ -2,10 +2,12 @@
 
 Usage:
     python -m src.pipeline photo --hours 2 --push
+    python -m src.pipeline photo --hours 2 --workers 4
     python -m src.pipeline photo --dry-run
     python -m src.pipeline photo --slices "2009*/1978"
     python -m src.pipeline photo --resume RUN_ID
     python -m src.pipeline doc --auto --batch 20 --delay 2
+    python -m src.pipeline doc --auto --workers 4
     python -m src.pipeline doc --auto --dry-run
     python -m src.pipeline doc --status
     python -m src.pipeline doc
@@ -14,11 +16,14 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
+import multiprocessing
+import os
 import re
 import shutil
 import sys
 import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -26,14 +31,14 @@ from pypdf import PdfReader
 
 from . import config
 from .analyze import analyze_photo
-from .convert import find_photos, needs_conversion, prepare_for_analysis, sha256_file
+from .convert import embedded_sha256, find_photos, hash_and_prepare, needs_conversion, sha256_file
 from .cost import estimate_doc_cost, estimate_photo_cost, format_cost_summary
 from .discover import build_batch_work_list, filter_work_list
 from .doc_analyze import analyze_document
 from .doc_extract_text import extract_text
 from .doc_manifest import (
     get_processed_hashes,
-    list_manifests as list_doc_manifests,
+    status_summary as doc_status_summary,
     text_dir as doc_text_dir,
     write_extracted_text,
     write_manifest as write_doc_manifest,
@@ -41,20 +46,44 @@ from .doc_manifest import (
 )
 from .immich import (
     _client as immich_client,
-    build_path_lookup,
+    build_name_lookup,
     create_album,
     date_estimate_to_iso,
     search_assets_by_path,
-    update_asset,
+    update_assets_bulk,
+)
+from .manifest import (
+    list_manifests,
+    load_manifest,
+    processed_manifest_names,
+    run_dir,
+    write_manifest,
+    write_run_meta,
 )
-from .manifest import load_manifest, list_manifests, write_manifest, write_run_meta
 from .preflight import check_immich, ensure_nas_mounted
+from .scan_cache import cached_entry, find_files, load_scan_cache, save_scan_cache, store_entry
 
 log = config.setup_logging()
 
 # Estimated seconds per photo (used for time estimates in dry-run)
 EST_SECONDS_PER_PHOTO = 32
 
+# Byte-size divisors for human-readable sizes in listings
+MB = 1024 ** 2
+GB = 1024 ** 3
+
+# Concurrent file hashes when scanning for uncached files
+HASH_WORKERS = min(8, os.cpu_count() or 1)
+
+# Concurrent photo conversions when preparing a slice workspace. Each one
+# holds a whole source scan plus its decoded raster in memory (100 MB+ for
+# uncompressed TIFFs), so this stays small: a few conversions are plenty to
+# stay ahead of ~30s analyses without pushing peak memory into the GBs.
+PREP_WORKERS = min(4, os.cpu_count() or 1)
+
+# Concurrent manifest reads when pushing a run to Immich
+MANIFEST_LOAD_WORKERS = 16
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
@@ -93,40 +122,48 @@ def _cleanup_workspace_safe(workspace: Path) -> None:
         log.warning("  Workspace cleanup failed for %s: %s", workspace, e)
 
 
-def _push_to_immich(run_id: str, slice_path: str | None = None) -> dict:
-    """Push manifest data to Immich: update dates/descriptions, create review albums."""
+def _push_to_immich(
+    run_id: str,
+    slice_path: str | None = None,
+    manifests: list[Path] | None = None,
+) -> dict:
+    """Push manifest data to Immich: update dates/descriptions, create review albums.
+
+    manifests: limit the push to these files (default: every manifest in the run).
+    """
     slice_path = slice_path or config.SLICE_PATH
 
-    manifests = list_manifests(run_id)
+    if manifests is None:
+        manifests = list_manifests(run_id)
     if not manifests:
         log.info("  No manifests to push.")
         return {"matched": 0, "updated": 0, "skipped": 0}
 
     client = immich_client()
 
-    log.info("  Searching Immich for assets matching '%s'...", slice_path)
-    assets = search_assets_by_path(client, slice_path)
-    log.info("  Found %d assets in Immich.", len(assets))
+    # Manifests are parsed on a pool while the Immich search is in flight
+    with ThreadPoolExecutor(max_workers=min(MANIFEST_LOAD_WORKERS, len(manifests))) as pool:
+        loading = pool.map(load_manifest, manifests)
+        log.info("  Searching Immich for assets matching '%s'...", slice_path)
+        assets = search_assets_by_path(client, slice_path)
+        log.info("  Found %d assets in Immich.", len(assets))
+        loaded = list(loading)
 
-    path_lookup = build_path_lookup(assets)
+    name_lookup = build_name_lookup(assets)
 
     matched = 0
-    updated = 0
     skipped = 0
+    updates: list[tuple[str, str | None, str | None]] = []
+    source_names: dict[str, list[str]] = {}
     needs_review_ids: list[str] = []
     low_confidence_ids: list[str] = []
 
-    for manifest_path in manifests:
-        m = load_manifest(manifest_path)
+    for m in loaded:
         source_file = m.source_file
         analysis = m.analysis
 
-        asset_id = None
         source_name = Path(source_file).name
-        for immich_path, aid in path_lookup.items():
-            if immich_path.endswith(source_name):
-                asset_id = aid
-                break
+        asset_id = name_lookup.get(source_name)
 
         if not asset_id:
             log.info("    No Immich match for: %s", source_name)
@@ -141,16 +178,12 @@ def _push_to_immich(run_id: str, slice_path: str | None = None) -> dict:
         if desc_zh:
             desc = f"{desc}\n\n{desc_zh}"
 
-        try:
-            update_asset(
-                client,
-                asset_id,
-                date_time_original=date_estimate_to_iso(date_est) if date_est else None,
-                description=desc if desc else None,
-            )
-            updated += 1
-        except Exception as e:
-            log.error("    Failed to update %s: %s", source_name, e)
+        updates.append((
+            asset_id,
+            date_estimate_to_iso(date_est) if date_est else None,
+            desc if desc else None,
+        ))
+        source_names.setdefault(asset_id, []).append(source_name)
 
         confidence = analysis.date_confidence
         if confidence < config.CONFIDENCE_LOW:
@@ -158,6 +191,11 @@ def _push_to_immich(run_id: str, slice_path: str | None = None) -> dict:
         elif confidence < config.CONFIDENCE_HIGH:
             needs_review_ids.append(asset_id)
 
+    update_failures = update_assets_bulk(client, updates)
+    for asset_id, e in update_failures.items():
+        log.error("    Failed to update %s: %s", ", ".join(source_names[asset_id]), e)
+    updated = len(source_names) - len(update_failures)
+
     if needs_review_ids:
         try:
             create_album(
@@ -185,17 +223,74 @@ def _push_to_immich(run_id: str, slice_path: str | None = None) -> dict:
     return {"matched": matched, "updated": updated, "skipped": skipped}
 
 
+def _prepare_photo(src: Path, workspace: Path) -> dict:
+    """Hash a source photo and write its analysis JPEG into the workspace."""
+    rel = src.relative_to(config.MEDIA_ROOT)
+    jpeg_path = workspace / (src.stem + ".jpg")
+
+    if needs_conversion(src):
+        sha = hash_and_prepare(src, jpeg_path)
+    else:
+        sha = sha256_file(src)
+        jpeg_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(src, jpeg_path)
+
+    return {
+        "source_path": src,
+        "jpeg_path": jpeg_path,
+        "sha256": sha,
+        "rel_path": str(rel),
+    }
+
+
+def _analyze_photos(
+    photos: Iterable[dict],
+    total: int,
+    slice_path: str,
+    max_workers: int,
+    has_budget: Callable[[int], bool],
+) -> Iterator[tuple[dict, tuple | Exception]]:
+    """Analyze photos on up to max_workers threads, yielding (photo, result) as each finishes.
+
+    photos may be a lazy iterable (e.g. still being prepared); total is only
+    used for progress logging. result is the (analysis, inference) pair, or
+    the exception analyze_photo raised. has_budget(i) is checked before
+    photo i is started; once it returns False no further photos are
+    submitted, but in-flight ones finish.
+    """
+    def analyze(photo: dict) -> tuple | Exception:
+        try:
+            return analyze_photo(photo["jpeg_path"], slice_path)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        in_flight = {}
+        for i, photo in enumerate(photos):
+            if not has_budget(i):
+                break
+            log.info("  [%d/%d] Analyzing: %s", i + 1, total, Path(photo["rel_path"]).name)
+            in_flight[pool.submit(analyze, photo)] = photo
+            if len(in_flight) >= max_workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield in_flight.pop(fut), fut.result()
+        for fut in as_completed(in_flight):
+            yield in_flight[fut], fut.result()
+
+
 def process_slice(
     slice_path: str,
     slice_dir: Path,
     run_id: str,
     budget_remaining: float,
     push: bool,
+    max_workers: int = 1,
 ) -> dict:
     """Process a single slice within the batch.
 
-    Converts photos, analyzes each with budget checks, optionally pushes to
-    Immich. Returns stats dict.
+    Converts photos, analyzes up to max_workers at a time with budget checks,
+    optionally pushes to Immich. Returns stats dict.
     """
     start = time.time()
     log.info("--- Slice: %s ---", slice_path)
@@ -219,99 +314,122 @@ def process_slice(
     workspace = _workspace_for_slice(run_id, slice_path)
     workspace.mkdir(parents=True, exist_ok=True)
 
-    photos = []
+    # Photos whose cached hash (size + mtime unchanged) already has a manifest
+    # are skipped before they are read or converted.
+    done_names = processed_manifest_names()
+    cache_path = config.AI_LAYER_DIR / "sha_cache.json"
+    cache = load_scan_cache(cache_path)
+    # Hash of every source in this slice seen so far, to find its manifests for the push
+    slice_shas: list[str] = []
+    to_prepare = []
     for src in sources:
-        rel = src.relative_to(config.MEDIA_ROOT)
-        jpeg_name = src.stem + ".jpg"
-        jpeg_path = workspace / jpeg_name
-        sha = sha256_file(src)
-
-        if needs_conversion(src):
-            prepare_for_analysis(src, jpeg_path)
-        else:
-            jpeg_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, jpeg_path)
-
-        photos.append({
-            "source_path": src,
-            "jpeg_path": jpeg_path,
-            "sha256": sha,
-            "rel_path": str(rel),
-        })
-
-    # Check for already-processed photos (skip them)
-    unprocessed = []
-    for photo in photos:
-        manifest_name = f"{photo['sha256'][:12]}.json"
-        ai_runs = config.AI_LAYER_DIR / "runs"
-        already_done = False
-        if ai_runs.exists():
-            for run_dir in ai_runs.iterdir():
-                if (run_dir / "manifests" / manifest_name).exists():
-                    already_done = True
-                    break
-        if already_done:
-            log.info("  Skipping (already processed): %s", Path(photo["rel_path"]).name)
+        st = src.stat()
+        entry = cached_entry(cache, str(src), st)
+        if entry:
+            slice_shas.append(entry["sha256"])
+        if entry and f"{entry['sha256'][:12]}.json" in done_names:
+            log.info("  Skipping (already processed): %s", src.name)
         else:
-            unprocessed.append(photo)
+            to_prepare.append((src, st))
 
-    if not unprocessed:
-        log.info("  All %d photos already processed, skipping slice.", len(photos))
+    if not to_prepare:
+        log.info("  All %d photos already processed, skipping slice.", len(sources))
         _cleanup_workspace_safe(workspace)
         return {
             "slice_path": slice_path,
             "photos_found": len(sources),
-            "photos_considered": len(photos),
+            "photos_considered": len(sources),
             "succeeded": 0,
             "failed": 0,
             "elapsed": time.time() - start,
             "budget_exhausted": False,
         }
 
-    log.info("  %d to analyze (%d already done).", len(unprocessed), len(photos) - len(unprocessed))
+    log.info("  %d to prepare and analyze (%d already done).",
+             len(to_prepare), len(sources) - len(to_prepare))
 
     succeeded = 0
     failed = 0
     budget_exhausted = False
 
-    for i, photo in enumerate(unprocessed):
-        elapsed_so_far = time.time() - start
-        time_left = budget_remaining - elapsed_so_far
+    def has_budget(i: int) -> bool:
+        nonlocal budget_exhausted
+        time_left = budget_remaining - (time.time() - start)
         if time_left < EST_SECONDS_PER_PHOTO and i > 0:
             log.info("  Budget exhausted (%.0fs left). Stopping slice.", time_left)
             budget_exhausted = True
-            break
-
-        name = Path(photo["rel_path"]).name
-        log.info("  [%d/%d] Analyzing: %s", i + 1, len(unprocessed), name)
+            return False
+        return True
 
+    def prepare(src: Path) -> dict | Exception:
         try:
-            analysis, inference_meta = analyze_photo(photo["jpeg_path"], slice_path)
-            write_manifest(
-                run_id=run_id,
-                source_file_rel=photo["rel_path"],
-                source_sha256=photo["sha256"],
-                analysis=analysis,
-                inference=inference_meta,
-            )
-            succeeded += 1
-            log.info("           -> %s (confidence: %s)",
-                     analysis.date_estimate or "?", analysis.date_confidence)
+            return _prepare_photo(src, workspace)
         except Exception as e:
-            failed += 1
-            log.error("           -> FAILED: %s", e)
+            return e
+
+    # Every conversion is queued up front on its own pool; results are handed
+    # to analysis in order as each one is ready, so the API isn't idle while
+    # the rest of the slice converts.
+    prep_pool = ThreadPoolExecutor(max_workers=min(PREP_WORKERS, len(to_prepare)))
+    prepared = prep_pool.map(lambda item: prepare(item[0]), to_prepare)
+
+    def unprocessed() -> Iterator[dict]:
+        nonlocal failed
+        for photo, (src, st) in zip(prepared, to_prepare):
+            # A bad scan fails on its own; analyses already in flight still land
+            if isinstance(photo, Exception):
+                failed += 1
+                log.error("  Prepare failed: %s: %s", src.name, photo)
+                continue
+            store_entry(cache, str(src), st, sha256=photo["sha256"])
+            slice_shas.append(photo["sha256"])
+            if f"{photo['sha256'][:12]}.json" in done_names:
+                log.info("  Skipping (already processed): %s", src.name)
+            else:
+                yield photo
 
-        if i < len(unprocessed) - 1:
-            time.sleep(0.5)
+    try:
+        # Manifests are written here, on the calling thread, as results arrive
+        for photo, result in _analyze_photos(unprocessed(), len(to_prepare), slice_path,
+                                             max(1, max_workers), has_budget):
+            name = Path(photo["rel_path"]).name
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                analysis, inference_meta = result
+                write_manifest(
+                    run_id=run_id,
+                    source_file_rel=photo["rel_path"],
+                    source_sha256=photo["sha256"],
+                    analysis=analysis,
+                    inference=inference_meta,
+                )
+                succeeded += 1
+                log.info("           -> %s: %s (confidence: %s)",
+                         name, analysis.date_estimate or "?", analysis.date_confidence)
+            except Exception as e:
+                failed += 1
+                log.error("           -> %s: FAILED: %s", name, e)
+    finally:
+        prep_pool.shutdown(cancel_futures=True)
+        save_scan_cache(cache_path, cache)
 
     if push and succeeded > 0:
         immich_errors = config.validate_immich_config()
         if immich_errors:
             log.warning("  Immich push skipped: %s", immich_errors[0])
         else:
-            log.info("  Pushing %d manifests to Immich...", succeeded)
             try:
-                _push_to_immich(run_id, slice_path=slice_path)
+                # Only this slice's manifests: earlier slices in the run were
+                # already pushed, and the Immich search is scoped to this slice.
+                # Ones from before a --resume are included, since they were
+                # skipped above and may never have been pushed.
+                # Manifests are named by hash, so no parsing is needed to find them.
+                manifest_dir = run_dir(run_id)
+                manifests = [p for p in dict.fromkeys(manifest_dir / f"{sha[:12]}.json" for sha in slice_shas)
+                             if p.exists()]
+                log.info("  Pushing %d manifests to Immich...", len(manifests))
+                _push_to_immich(run_id, slice_path=slice_path, manifests=manifests)
             except Exception as e:
                 log.error("  Immich push failed: %s", e)
 
@@ -324,7 +442,7 @@ def process_slice(
     return {
         "slice_path": slice_path,
         "photos_found": len(sources),
-        "photos_considered": len(photos),
+        "photos_considered": len(sources),
         "succeeded": succeeded,
         "failed": failed,
         "elapsed": round(elapsed, 1),
@@ -452,6 +570,7 @@ def run_photo(args: argparse.Namespace) -> int:
             run_id=run_id,
             budget_remaining=budget_left,
             push=args.push,
+            max_workers=args.workers or config.PHOTO_WORKERS,
         )
         results.append(result)
 
@@ -501,31 +620,56 @@ def run_photo(args: argparse.Namespace) -> int:
 # DOCUMENT PIPELINE
 # ===========================================================================
 
+def _pdf_page_count(pdf: Path) -> int:
+    """Read a PDF's page count from the page-tree root without walking pages."""
+    try:
+        return int(PdfReader(pdf).trailer["/Root"]["/Pages"]["/Count"])
+    except Exception as e:
+        log.warning("    Warning: could not read page count: %s", e)
+        return 0
+
+
 def _scan_pdfs(directory: Path) -> list[dict]:
-    """Scan all PDFs in directory: path, hash, size, page count."""
-    pdfs = sorted(p for p in directory.rglob("*")
-                  if p.suffix.lower() == ".pdf" and not p.name.startswith("."))
-    results = []
-    for pdf in pdfs:
+    """Scan all PDFs in directory: path, hash, size, page count.
+
+    Hash and page count are reused from the scan cache for files whose size
+    and mtime are unchanged, so rescans don't re-read every PDF from the NAS.
+    On a miss, a hash embedded in the file name is trusted as-is.
+    """
+    cache_path = config.DOC_AI_LAYER_DIR / "sha_cache.json"
+    cache = load_scan_cache(cache_path)
+    scanned = []
+    misses = []
+    for pdf, st in find_files(directory, {".pdf"}):
         try:
             rel = pdf.relative_to(config.DOCUMENTS_ROOT)
         except ValueError:
             rel = pdf.relative_to(config.DOC_SLICE_DIR)
         log.info("  Scanning: %s", rel)
-        size = pdf.stat().st_size
-        try:
-            pages = len(PdfReader(pdf).pages)
-        except Exception as e:
-            log.warning("    Warning: could not read page count: %s", e)
-            pages = 0
-        results.append({
+        scanned.append((pdf, rel, st))
+        entry = cached_entry(cache, str(pdf), st)
+        if entry is None or "page_count" not in entry:
+            misses.append((pdf, st))
+
+    if misses:
+        # file_digest releases the GIL, so threads hash on separate cores
+        with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(misses))) as pool:
+            hashes = pool.map(lambda pdf: embedded_sha256(pdf) or sha256_file(pdf),
+                              [pdf for pdf, _ in misses])
+            for (pdf, st), sha in zip(misses, hashes):
+                store_entry(cache, str(pdf), st, sha256=sha, page_count=_pdf_page_count(pdf))
+        save_scan_cache(cache_path, cache)
+
+    return [
+        {
             "path": pdf,
             "rel_path": str(rel),
-            "sha256": sha256_file(pdf),
-            "file_size_bytes": size,
-            "page_count": pages,
-        })
-    return results
+            "sha256": cache[str(pdf)]["sha256"],
+            "file_size_bytes": st.st_size,
+            "page_count": cache[str(pdf)]["page_count"],
+        }
+        for pdf, rel, st in scanned
+    ]
 
 
 def _find_latest_doc_run() -> Path | None:
@@ -533,8 +677,9 @@ def _find_latest_doc_run() -> Path | None:
     runs_dir = config.DOC_AI_LAYER_DIR / "runs"
     if not runs_dir.exists():
         return None
-    runs = sorted((p for p in runs_dir.iterdir() if p.is_dir()), reverse=True)
-    return runs[0] if runs else None
+    with os.scandir(runs_dir) as entries:
+        latest = max((e.name for e in entries if e.is_dir()), default=None)
+    return runs_dir / latest if latest else None
 
 
 def _build_doc_work_list(run_id: str) -> list[dict]:
@@ -553,6 +698,15 @@ def _build_doc_work_list(run_id: str) -> list[dict]:
     return remaining
 
 
+def _doc_totals(work: list[dict]) -> tuple[int, int]:
+    """Return (total bytes, total pages) for a work list in one pass."""
+    total_size = total_pages = 0
+    for w in work:
+        total_size += w["file_size_bytes"]
+        total_pages += w["page_count"]
+    return total_size, total_pages
+
+
 def _print_doc_work_list(work: list[dict]) -> None:
     """Print the work list as a flat sorted table."""
     if not work:
@@ -560,40 +714,35 @@ def _print_doc_work_list(work: list[dict]) -> None:
         log.info("All documents have been processed.")
         return
 
-    total_size = sum(w["file_size_bytes"] for w in work)
-    total_pages = sum(w["page_count"] for w in work)
+    total_size, total_pages = _doc_totals(work)
 
     log.info("")
     log.info("Documents to process: %d (%.2f GB, %d pages)",
-             len(work), total_size / (1024**3), total_pages)
-    for w in work:
-        mb = w["file_size_bytes"] / (1024**2)
-        log.info("  %6.1f MB  (%4d pp)  %s", mb, w["page_count"], w["rel_path"])
+             len(work), total_size / GB, total_pages)
+    log.info("\n".join(
+        f"  {w['file_size_bytes'] / MB:6.1f} MB  ({w['page_count']:4d} pp)  {w['rel_path']}"
+        for w in work
+    ))
 
 
 def _print_doc_status(run_id: str) -> None:
     """Print status of a doc run: manifest + text-file counts, doc-type breakdown."""
-    manifests = list_doc_manifests(run_id)
+    summary = doc_status_summary(run_id)
     td = doc_text_dir(run_id)
-    text_files = sorted(td.glob("*.txt")) if td.exists() else []
+    text_count = 0
+    if td.exists():
+        with os.scandir(td) as it:
+            text_count = sum(1 for entry in it if entry.name.endswith(".txt"))
 
     log.info("")
     log.info("Run: %s", run_id)
-    log.info("  Manifests: %d", len(manifests))
-    log.info("  Text files: %d", len(text_files))
-
-    if manifests:
-        total_pages = 0
-        doc_types: dict[str, int] = {}
-        for mp in manifests:
-            data = json.loads(mp.read_text())
-            total_pages += data.get("page_count", 0)
-            dt = data.get("analysis", {}).get("document_type", "unknown")
-            doc_types[dt] = doc_types.get(dt, 0) + 1
-
-        log.info("  Total pages covered: %d", total_pages)
+    log.info("  Manifests: %d", summary["manifests"])
+    log.info("  Text files: %d", text_count)
+
+    if summary["manifests"]:
+        log.info("  Total pages covered: %d", summary["total_pages"])
         log.info("  Document types:")
-        for dt, count in sorted(doc_types.items(), key=lambda x: -x[1]):
+        for dt, count in summary["doc_types"].most_common():
             log.info("    %3d  %s", count, dt)
 
 
@@ -601,24 +750,21 @@ def _doc_dry_run(work: list[dict], batch_size: int) -> None:
     """Show what would be processed without calling the LLM."""
     batch = work[:batch_size] if batch_size > 0 else work
 
-    total_chars = sum(w["file_size_bytes"] for w in batch)
-    total_pages = sum(w["page_count"] for w in batch)
+    total_chars, total_pages = _doc_totals(batch)
     est_tokens = total_chars // 4
 
     log.info("")
     log.info("DRY RUN — %d of %d remaining documents", len(batch), len(work))
-    log.info("  Total file size: %.2f MB", total_chars / (1024**2))
+    log.info("  Total file size: %.2f MB", total_chars / MB)
     log.info("  Total pages: %d", total_pages)
     log.info("  Estimated input tokens: ~%d (%.0fk)", est_tokens, est_tokens / 1000)
     log.info("")
 
-    for i, w in enumerate(batch, 1):
-        mb = w["file_size_bytes"] / (1024**2)
-        est = w["file_size_bytes"] // 4
-        log.info(
-            "  [%d] %s  (%.1f MB, %d pp, ~%dk tokens)",
-            i, w["rel_path"], mb, w["page_count"], est // 1000,
-        )
+    log.info("\n".join(
+        f"  [{i}] {w['rel_path']}  ({w['file_size_bytes'] / MB:.1f} MB, "
+        f"{w['page_count']} pp, ~{w['file_size_bytes'] // 4 // 1000}k tokens)"
+        for i, w in enumerate(batch, 1)
+    ))
 
     estimate = estimate_doc_cost(total_chars, len(batch))
     log.info("")
@@ -629,9 +775,126 @@ def _doc_dry_run(work: list[dict], batch_size: int) -> None:
         log.info("  ... %d more documents remain after this batch", len(work) - len(batch))
 
 
-def _auto_extract(run_id: str, work: list[dict], batch_size: int, pacing_delay: float) -> int:
+def _process_doc(
+    run_id: str,
+    w: dict,
+    index: int,
+    total: int,
+    extract_pool: ProcessPoolExecutor | None = None,
+) -> dict:
+    """Extract text + analyze one document, writing its manifest on success.
+
+    Runs in a worker thread when --workers > 1; extraction is handed to
+    extract_pool (pypdf is CPU-bound) while the LLM call stays on the thread.
+    Returns an outcome dict with "status" of "ok", "skipped" or "failed".
+    """
+    pdf_path = Path(w["path"])
+    rel_path = w["rel_path"]
+    sha = w["sha256"]
+    pages = w["page_count"]
+    mb = w["file_size_bytes"] / MB
+
+    log.info("")
+    log.info("[%d/%d] %s (%.1f MB, %d pp)", index, total, rel_path, mb, pages)
+
+    try:
+        doc_start = time.monotonic()
+        if extract_pool is not None:
+            result = extract_pool.submit(extract_text, pdf_path).result()
+        else:
+            result = extract_text(pdf_path)
+
+        if result.is_empty:
+            log.warning("  SKIP: no text extracted (scanned image PDF, OCR needed): %s", rel_path)
+            return {"status": "skipped"}
+
+        log.info("  Extracted %d chars from %d pages: %s", result.chars_extracted, result.total_pages, rel_path)
+        text = result.full_text
+        write_extracted_text(run_id, sha, text)
+
+        log.info("  Analyzing: %s", rel_path)
+        analysis, inference = analyze_document(
+            text=text,
+            source_file=rel_path,
+            page_count=pages,
+        )
+
+        write_doc_manifest(
+            run_id=run_id,
+            source_file_rel=rel_path,
+            source_sha256=sha,
+            file_size_bytes=w["file_size_bytes"],
+            page_count=pages,
+            extraction={"chars_extracted": result.chars_extracted},
+            analysis=analysis.model_dump(),
+            inference=inference.model_dump(),
+        )
+
+        log.info("  OK: %s: %s — %s (%.1fs)", rel_path,
+                 analysis.document_type, analysis.title[:60], time.monotonic() - doc_start)
+        return {"status": "ok", "inference": inference, "chars": result.chars_extracted}
+
+    except Exception as exc:
+        transient = config.is_transient_error(exc)
+        log.error("  FAIL%s: %s: %s: %s", " (transient, rerun to retry)" if transient else "",
+                  rel_path, type(exc).__name__, exc)
+        return {
+            "status": "failed",
+            "failure": {
+                "source_file": rel_path,
+                "sha256": sha,
+                "error": f"{type(exc).__name__}: {exc}",
+                "transient": transient,
+            },
+        }
+
+
+def _iter_doc_outcomes(
+    run_id: str,
+    work: list[dict],
+    max_workers: int,
+    pacing_delay: float,
+) -> Iterator[dict]:
+    """Yield _process_doc outcomes, sequentially or as worker pools finish them."""
+    total = len(work)
+    if max_workers <= 1:
+        for i, w in enumerate(work, 1):
+            outcome = _process_doc(run_id, w, i, total)
+            yield outcome
+            if pacing_delay > 0 and i < total and outcome["status"] != "skipped":
+                time.sleep(pacing_delay)
+        return
+
+    # Longest-processing-time first: start the biggest PDFs immediately so
+    # small ones fill the gaps, instead of one large file running alone at
+    # the tail. The batch itself is still chosen smallest-first upstream.
+    work = sorted(work, key=lambda w: w["file_size_bytes"], reverse=True)
+    extract_workers = min(max_workers, os.cpu_count() or 1)
+    # spawn, not fork: workers are started from pool threads, and forking a
+    # multithreaded process can deadlock the child on a held lock (logging).
+    with ProcessPoolExecutor(
+        max_workers=extract_workers, mp_context=multiprocessing.get_context("spawn"),
+    ) as extract_pool, \
+            ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_process_doc, run_id, w, i, total, extract_pool)
+            for i, w in enumerate(work, 1)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _auto_extract(
+    run_id: str,
+    work: list[dict],
+    batch_size: int,
+    pacing_delay: float,
+    max_workers: int = 1,
+) -> int:
     """Extract text + analyze each document, writing manifest on success.
 
+    With max_workers > 1, documents are processed concurrently and
+    pacing_delay is ignored.
     Returns an exit code (0 ok, 1 if any failed).
     """
     full_remaining = len(work)
@@ -644,7 +907,9 @@ def _auto_extract(run_id: str, work: list[dict], batch_size: int, pacing_delay:
     log.info("Run ID: %s", run_id)
     log.info("Documents: %d%s", len(work),
              f" (batch of {batch_size}, {full_remaining} remaining)" if batch_size > 0 else "")
-    if pacing_delay > 0:
+    if max_workers > 1:
+        log.info("Workers: %d (pacing delay ignored)", max_workers)
+    elif pacing_delay > 0:
         log.info("Pacing delay: %.1fs between documents", pacing_delay)
     log.info("=" * 60)
 
@@ -658,70 +923,24 @@ def _auto_extract(run_id: str, work: list[dict], batch_size: int, pacing_delay:
     total_chars = 0
     start_time = time.monotonic()
 
-    for i, w in enumerate(work, 1):
-        pdf_path = Path(w["path"])
-        rel_path = w["rel_path"]
-        sha = w["sha256"]
-        pages = w["page_count"]
-        mb = w["file_size_bytes"] / (1024**2)
-
-        log.info("")
-        log.info("[%d/%d] %s (%.1f MB, %d pp)", i, len(work), rel_path, mb, pages)
-
-        try:
-            doc_start = time.monotonic()
-            result = extract_text(pdf_path)
-
-            if result.is_empty:
-                log.warning("  SKIP: no text extracted (scanned image PDF, OCR needed)")
-                skipped += 1
-                continue
-
-            log.info("  Extracted %d chars from %d pages", result.chars_extracted, result.total_pages)
-            write_extracted_text(run_id, sha, result.full_text)
-
-            log.info("  Analyzing...")
-            analysis, inference = analyze_document(
-                text=result.full_text,
-                source_file=rel_path,
-                page_count=pages,
-            )
-
-            write_doc_manifest(
-                run_id=run_id,
-                source_file_rel=rel_path,
-                source_sha256=sha,
-                file_size_bytes=w["file_size_bytes"],
-                page_count=pages,
-                extraction={"chars_extracted": result.chars_extracted},
-                analysis=analysis.model_dump(),
-                inference=inference.model_dump(),
-            )
-
-            elapsed = time.monotonic() - doc_start
-            total_input_tokens += inference.input_tokens
-            total_output_tokens += inference.output_tokens
-            total_estimated_tokens += inference.estimated_input_tokens
-            total_chars += result.chars_extracted
-
-            log.info("  OK: %s — %s (%.1fs)",
-                     analysis.document_type, analysis.title[:60], elapsed)
-            log.info("  Usage so far: %d input / %d output tokens (est. ~%dk input)",
-                     total_input_tokens, total_output_tokens,
-                     total_estimated_tokens // 1000)
-            succeeded += 1
-
-        except Exception as exc:
-            log.error("  FAIL: %s: %s", type(exc).__name__, exc)
+    for outcome in _iter_doc_outcomes(run_id, work, max_workers, pacing_delay):
+        if outcome["status"] == "skipped":
+            skipped += 1
+            continue
+        if outcome["status"] == "failed":
             failed += 1
-            failures.append({
-                "source_file": rel_path,
-                "sha256": sha,
-                "error": f"{type(exc).__name__}: {exc}",
-            })
+            failures.append(outcome["failure"])
+            continue
 
-        if pacing_delay > 0 and i < len(work):
-            time.sleep(pacing_delay)
+        inference = outcome["inference"]
+        total_input_tokens += inference.input_tokens
+        total_output_tokens += inference.output_tokens
+        total_estimated_tokens += inference.estimated_input_tokens
+        total_chars += outcome["chars"]
+        log.info("  Usage so far: %d input / %d output tokens (est. ~%dk input)",
+                 total_input_tokens, total_output_tokens,
+                 total_estimated_tokens // 1000)
+        succeeded += 1
 
     total_elapsed = time.monotonic() - start_time
 
@@ -736,7 +955,7 @@ def _auto_extract(run_id: str, work: list[dict], batch_size: int, pacing_delay:
     log.info("=" * 60)
     log.info("Run complete: %s", run_id)
     log.info("  Succeeded: %d", succeeded)
-    log.info("  Failed: %d", failed)
+    log.info("  Failed: %d (%d transient)", failed, sum(f["transient"] for f in failures))
     log.info("  Skipped: %d (no text)", skipped)
     log.info("  Elapsed: %.1fs", total_elapsed)
     log.info("  Tokens: %d input / %d output (est. ~%dk input)",
@@ -828,6 +1047,7 @@ def run_doc(args: argparse.Namespace) -> int:
 
     batch_size = args.batch or config.DOC_BATCH_SIZE
     pacing_delay = args.delay or config.DOC_PACING_DELAY
+    max_workers = args.workers or config.DOC_WORKERS
 
     if args.dry_run:
         _doc_dry_run(work, batch_size)
@@ -837,7 +1057,8 @@ def run_doc(args: argparse.Namespace) -> int:
         if not work:
             log.info("No documents to process.")
             return 0
-        return _auto_extract(run_id, work, batch_size=batch_size, pacing_delay=pacing_delay)
+        return _auto_extract(run_id, work, batch_size=batch_size, pacing_delay=pacing_delay,
+                             max_workers=max_workers)
 
     _print_doc_work_list(work)
     return 0
@@ -865,6 +1086,8 @@ def main():
                        help="Resume an interrupted batch run")
     photo.add_argument("--slices", nargs="+", metavar="PATTERN",
                        help="Filter slices by glob pattern (e.g. '2009*' '*/Album')")
+    photo.add_argument("--workers", metavar="N", type=int, default=0,
+                       help="Analyze N photos concurrently (default: 1)")
 
     # document subparser
     doc = subparsers.add_parser("doc", help="Run the document pipeline")
@@ -878,6 +1101,8 @@ def main():
                      help="Process at most N documents (0 = all)")
     doc.add_argument("--delay", metavar="SECS", type=float, default=0,
                      help="Seconds to pause between documents")
+    doc.add_argument("--workers", metavar="N", type=int, default=0,
+                     help="Process N documents concurrently (default: 1)")
     doc.add_argument("--dry-run", action="store_true",
                      help="Show what would be processed without calling LLM")
 
@@ -3,7 +3,9 @@
 import logging
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import httpx
@@ -107,7 +109,7 @@ def ensure_nas_mounted(
     return False
 
 
-# Backward-compatible alias
+# Backward-compatible alias for external callers; internal code uses ensure_nas_mounted
 check_nas_mount = ensure_nas_mounted
 
 
@@ -121,18 +123,17 @@ def check_immich(url: str | None = None, api_key: str | None = None) -> bool:
         return False
 
     try:
-        resp = httpx.get(
-            f"{url}/api/server/ping",
-            headers={"x-api-key": api_key},
-            timeout=5.0,
-        )
+        # Ping and version are independent requests — issue both at once so
+        # the check costs one round-trip (and one timeout) instead of two.
+        with httpx.Client(
+            base_url=url, headers={"x-api-key": api_key}, timeout=5.0,
+        ) as client, ThreadPoolExecutor(max_workers=2) as pool:
+            ping_future = pool.submit(client.get, "/api/server/ping")
+            version_future = pool.submit(client.get, "/api/server/version")
+            resp = ping_future.result()
+            auth_resp = version_future.result()
         if resp.status_code == 200 and resp.json().get("res") == "pong":
-            # Also check auth by hitting a protected endpoint
-            auth_resp = httpx.get(
-                f"{url}/api/server/version",
-                headers={"x-api-key": api_key},
-                timeout=5.0,
-            )
+            # Version is a protected endpoint, so it doubles as the auth check
             if auth_resp.status_code == 200:
                 v = auth_resp.json()
                 log.info("  Immich reachable: %s (v%s.%s.%s)",
@@ -151,6 +152,29 @@ def check_immich(url: str | None = None, api_key: str | None = None) -> bool:
         return False
 
 
+def _run_holding_logs(fn, records: list[logging.LogRecord]):
+    """Call fn, collecting the records it logs on this thread instead of emitting them."""
+    ident = threading.get_ident()
+
+    def hold(record: logging.LogRecord) -> bool:
+        if record.thread == ident:
+            records.append(record)
+            return False
+        return True
+
+    log.addFilter(hold)
+    try:
+        return fn()
+    finally:
+        log.removeFilter(hold)
+
+
+def _emit(records: list[logging.LogRecord]) -> None:
+    """Emit held log records, in the order they were logged."""
+    for record in records:
+        log.handle(record)
+
+
 def run_preflight(require_immich: bool = True) -> bool:
     """Run all preflight checks. Returns True if all pass.
 
@@ -160,8 +184,19 @@ def run_preflight(require_immich: bool = True) -> bool:
     log.info("Preflight checks...")
     all_ok = True
 
-    # 1. NAS mount
-    if not check_nas_mount():
+    # NAS mount and Immich are independent network checks with multi-second
+    # timeouts — run them concurrently so preflight costs the slower of the
+    # two rather than their sum. The NAS check logs live on this thread (an
+    # auto-mount can take minutes and reports progress); Immich's messages
+    # are held and emitted in their usual place below, so the two don't
+    # interleave.
+    immich_logs: list[logging.LogRecord] = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        immich_future = pool.submit(_run_holding_logs, check_immich, immich_logs)
+
+        # 1. NAS mount
+        nas_ok = ensure_nas_mounted()
+    if not nas_ok:
         all_ok = False
 
     # 2. Slice directory exists
@@ -172,7 +207,10 @@ def run_preflight(require_immich: bool = True) -> bool:
         log.info("  Slice directory: %s", config.SLICE_DIR)
 
     # 3. Immich
-    immich_ok = check_immich()
+    try:
+        immich_ok = immich_future.result()
+    finally:
+        _emit(immich_logs)
     if not immich_ok:
         if require_immich:
             all_ok = False
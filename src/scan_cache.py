@@ -0,0 +1,83 @@
+"""Stat-keyed sidecar cache for per-file scan results, and the scan walker.
+
+Rescanning a source slice otherwise re-reads every file on the NAS just to
+recompute hashes that haven't changed. Entries are keyed by absolute path
+and trusted while the file's size and mtime match — the same rule
+catalog.scan_directory uses to call a file unchanged.
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from pydantic_core import from_json, to_json
+
+log = logging.getLogger(__name__)
+
+
+def find_files(directory: Path, extensions: set[str]) -> list[tuple[Path, os.stat_result]]:
+    """Recursively list non-hidden files with the given suffixes, sorted by path.
+
+    Walks with os.scandir so entry types come from the directory listing
+    itself and each matching file is stat'ed once, which matters over SMB.
+    Like Path.rglob, symlinked directories are not descended into and
+    unreadable directories are skipped. Returns (path, stat) pairs.
+    """
+    found = []
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except PermissionError as e:
+            log.warning("Skipping unreadable directory %s: %s", current, e)
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif (os.path.splitext(entry.name)[1].lower() in extensions
+                  and not entry.name.startswith(".") and entry.is_file()):
+                found.append((Path(entry.path), entry.stat()))
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+def load_scan_cache(path: Path) -> dict[str, dict]:
+    """Load a scan cache. Returns an empty cache if missing or unreadable."""
+    try:
+        return from_json(path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        log.warning("Ignoring unreadable scan cache %s: %s", path, e)
+        return {}
+
+
+def save_scan_cache(path: Path, cache: dict[str, dict]) -> None:
+    """Atomically write the scan cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with open(fd, "wb") as f:
+            f.write(to_json(cache))
+        Path(tmp).rename(path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def cached_entry(cache: dict[str, dict], key: str, st: os.stat_result) -> dict | None:
+    """Return the entry for key if the file's size and mtime still match."""
+    entry = cache.get(key)
+    if entry and entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns:
+        return entry
+    return None
+
+
+def store_entry(cache: dict[str, dict], key: str, st: os.stat_result, **fields) -> dict:
+    """Record fields for key under the file's current size and mtime."""
+    entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, **fields}
+    cache[key] = entry
+    return entry
@@ -13,14 +13,13 @@ import sys
 from . import config
 from .immich import (
     _client as immich_client,
-    get_person_statistics,
+    get_people_statistics,
     list_people,
     update_person,
 )
 from .people import (
     REGISTRY_PATH,
-    add_person,
-    find_person_by_immich_id,
+    add_people_bulk,
     load_registry,
     save_registry,
 )
@@ -78,32 +77,34 @@ def cmd_pull():
     people = list_people(client)
     log.info("  Immich clusters: %d", len(people))
 
-    imported = 0
     skipped_small = 0
-    skipped_linked = 0
+    entries: list[dict] = []
+    asset_counts: list[int] = []
 
-    for p in people:
-        pid = p["id"]
+    linked_ids = {iid for person in registry.people for iid in person.immich_person_ids}
+    unlinked = [p for p in people if p["id"] not in linked_ids]
+    skipped_linked = len(people) - len(unlinked)
 
-        if find_person_by_immich_id(registry, pid):
-            skipped_linked += 1
-            continue
+    stats_by_id = get_people_statistics(client, [p["id"] for p in unlinked])
 
-        stats = get_person_statistics(client, pid)
-        asset_count = stats.get("assets", 0)
+    for p in unlinked:
+        pid = p["id"]
+        asset_count = stats_by_id[pid].get("assets", 0)
         if asset_count < MIN_ASSETS_FOR_IMPORT:
             skipped_small += 1
             continue
 
-        name = p.get("name", "")
-        person = add_person(
-            registry,
-            name_en=name,
-            immich_person_ids=[pid],
-            notes=f"Auto-imported from Immich ({asset_count} assets)",
-        )
-        imported += 1
-        label = name if name else "(unnamed)"
+        entries.append({
+            "name_en": p.get("name", ""),
+            "immich_person_ids": [pid],
+            "notes": f"Auto-imported from Immich ({asset_count} assets)",
+        })
+        asset_counts.append(asset_count)
+
+    added = add_people_bulk(registry, entries)
+    imported = len(added)
+    for person, asset_count in zip(added, asset_counts):
+        label = person.name_en if person.name_en else "(unnamed)"
         log.info("  Imported: %s — %d assets [%s]", label, asset_count, person.person_id[:8])
 
     save_registry(registry)
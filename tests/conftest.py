@@ -1,11 +1,37 @@
 """Shared fixtures for Living Archive tests."""
 
+import os
+import shutil
+import sys
+import tempfile
+
 import pytest
 
+_shm_basetemp = pytest.StashKey[str]()
 
-@pytest.fixture
+
+def pytest_configure(config):
+    """On Linux, keep tmp_path on tmpfs unless --basetemp was given.
+
+    Each run gets its own directory, since pytest wipes basetemp on startup
+    and concurrent runs would otherwise delete each other's files.
+    """
+    if sys.platform == "linux" and config.option.basetemp is None and os.access("/dev/shm", os.W_OK):
+        basetemp = tempfile.mkdtemp(dir="/dev/shm", prefix="living-archive-pytest-")
+        config.stash[_shm_basetemp] = basetemp
+        config.option.basetemp = basetemp
+
+
+def pytest_unconfigure(config):
+    """Free the tmpfs directory; it would otherwise hold RAM until reboot."""
+    basetemp = config.stash.get(_shm_basetemp, None)
+    if basetemp:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
 def sample_photo_json() -> dict:
-    """A valid photo analysis JSON matching the prompt schema."""
+    """A valid photo analysis JSON matching the prompt schema. Shared; don't mutate."""
     return {
         "date_estimate": "1978-06",
         "date_precision": "month",
@@ -24,9 +50,9 @@ def sample_photo_json() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_document_json() -> dict:
-    """A valid document analysis JSON matching the prompt schema."""
+    """A valid document analysis JSON matching the prompt schema. Shared; don't mutate."""
     return {
         "document_type": "legal/trust",
         "title": "Liu Family Living Trust Agreement",
@@ -53,7 +79,7 @@ def sample_photo_manifest(sample_photo_json) -> dict:
     return {
         "source_file": "2009 Scanned Media/1978/photo001.tif",
         "source_sha256": "abcdef123456abcdef123456abcdef123456abcdef123456abcdef123456abcd",
-        "analysis": sample_photo_json,
+        "analysis": dict(sample_photo_json),
         "inference": {
             "model": "claude-sonnet-4-20250514",
             "prompt_version": "photo_analysis_v1",
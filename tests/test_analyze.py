@@ -8,38 +8,21 @@ from src.analyze import strip_json_fences
 
 
 class TestStripJsonFences:
-    def test_clean_json(self):
-        """Plain JSON should pass through unchanged."""
-        raw = '{"date_estimate": "1978-06"}'
-        assert strip_json_fences(raw) == raw
-
-    def test_markdown_fenced_json(self):
-        """```json ... ``` fences should be stripped."""
-        raw = '```json\n{"date_estimate": "1978-06"}\n```'
-        result = strip_json_fences(raw)
-        parsed = json.loads(result)
-        assert parsed["date_estimate"] == "1978-06"
-
-    def test_markdown_fenced_no_language(self):
-        """``` ... ``` fences without language tag should be stripped."""
-        raw = '```\n{"key": "value"}\n```'
-        result = strip_json_fences(raw)
-        parsed = json.loads(result)
-        assert parsed["key"] == "value"
-
-    def test_multiline_fenced_json(self):
-        """Multi-line fenced JSON should be fully extracted."""
-        raw = '```json\n{\n  "a": 1,\n  "b": 2\n}\n```'
-        result = strip_json_fences(raw)
-        parsed = json.loads(result)
-        assert parsed == {"a": 1, "b": 2}
-
-    def test_whitespace_around_json(self):
-        """Leading/trailing whitespace should be trimmed."""
-        raw = '  \n  {"key": "value"}  \n  '
-        result = strip_json_fences(raw)
-        parsed = json.loads(result)
-        assert parsed["key"] == "value"
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param('{"date_estimate": "1978-06"}', '{"date_estimate": "1978-06"}', id="clean"),
+            pytest.param('```json\n{"date_estimate": "1978-06"}\n```', '{"date_estimate": "1978-06"}',
+                         id="fenced-json"),
+            pytest.param('```\n{"key": "value"}\n```', '{"key": "value"}', id="fenced-no-language"),
+            pytest.param('```json\n{\n  "a": 1,\n  "b": 2\n}\n```', '{\n  "a": 1,\n  "b": 2\n}',
+                         id="fenced-multiline"),
+            pytest.param('  \n  {"key": "value"}  \n  ', '{"key": "value"}', id="surrounding-whitespace"),
+        ],
+    )
+    def test_strips_to_json(self, raw, expected):
+        """Fences and surrounding whitespace go; the JSON body is left intact."""
+        assert strip_json_fences(raw) == expected
 
     def test_malformed_json_raises(self):
         """Malformed JSON should raise when parsed."""
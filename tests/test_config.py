@@ -0,0 +1,57 @@
+"""Tests for config.py: retry backoff and transient-error classification."""
+
+import httpx
+import pytest
+
+import src.config as config
+
+
+def _status_error(code):
+    request = httpx.Request("GET", "http://immich.test/api")
+    return httpx.HTTPStatusError("boom", request=request, response=httpx.Response(code, request=request))
+
+
+class TestIsTransientError:
+    @pytest.mark.parametrize("code", [429, 500, 502, 503, 529])
+    def test_retryable_status(self, code):
+        assert config.is_transient_error(_status_error(code))
+
+    @pytest.mark.parametrize("code", [400, 401, 403, 404])
+    def test_client_errors_are_permanent(self, code):
+        assert not config.is_transient_error(_status_error(code))
+
+    def test_connection_error_is_transient(self):
+        assert config.is_transient_error(httpx.ConnectError("refused"))
+
+    def test_other_exceptions_are_permanent(self):
+        assert not config.is_transient_error(ValueError("bad pdf"))
+
+
+class TestRetry:
+    def test_jittered_backoff(self, monkeypatch):
+        """Delays stay within 50-100% of the exponential backoff."""
+        delays = []
+        monkeypatch.setattr(config._time, "sleep", delays.append)
+        calls = []
+
+        @config.retry(max_attempts=3, base_delay=2.0)
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise httpx.ConnectError("refused")
+            return "ok"
+
+        assert flaky() == "ok"
+        assert len(delays) == 2
+        assert 1.0 <= delays[0] <= 2.0
+        assert 2.0 <= delays[1] <= 4.0
+
+    def test_permanent_error_not_retried(self, monkeypatch):
+        monkeypatch.setattr(config._time, "sleep", lambda s: pytest.fail("should not sleep"))
+
+        @config.retry()
+        def broken():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            broken()
@@ -1,8 +1,16 @@
 """Tests for convert.py: file discovery, preparation, and SHA-256 hashing."""
 
+import pytest
 from PIL import Image
 
-from src.convert import find_photos, needs_conversion, prepare_for_analysis, sha256_file
+from src.convert import (
+    embedded_sha256,
+    find_photos,
+    hash_and_prepare,
+    needs_conversion,
+    prepare_for_analysis,
+    sha256_file,
+)
 
 
 class TestSha256File:
@@ -26,8 +34,24 @@ class TestSha256File:
         f = tmp_path / "binary.bin"
         f.write_bytes(bytes(range(256)))
         result = sha256_file(f)
-        assert len(result) == 64  # SHA-256 hex digest is 64 chars
-        assert all(c in "0123456789abcdef" for c in result)
+        # SHA-256 of bytes 0x00..0xff
+        assert result == "40aff2e9d2d8922e47afd4648e6967497158785fbd1da870e7110266bf944880"
+
+
+class TestEmbeddedSha256:
+    def test_hash_named_file(self, tmp_path):
+        """A <sha256>.pdf name yields the digest, normalized to lowercase."""
+        digest = "B94D27B9934D3E08A52E52D7DA7DABFAC484EFE37A5380EE9088F7ACE2EFCDE9"
+        assert embedded_sha256(tmp_path / f"{digest}.pdf") == digest.lower()
+
+    def test_hash_with_prefix(self, tmp_path):
+        digest = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+        assert embedded_sha256(tmp_path / f"scan_{digest}.pdf") == digest
+
+    def test_plain_or_too_long_names(self, tmp_path):
+        """Ordinary names and longer hex runs are not mistaken for a digest."""
+        assert embedded_sha256(tmp_path / "tax-return-1987.pdf") is None
+        assert embedded_sha256(tmp_path / ("a" * 65 + ".pdf")) is None
 
 
 def _make_image(path, size=(100, 80)):
@@ -79,6 +103,16 @@ class TestFindPhotos:
         result = find_photos(tmp_path)
         assert result == sorted(result)
 
+    def test_skips_subdirectories(self, tmp_path):
+        """Subdirectories, even ones named like photos, and nested photos are not listed."""
+        _make_image(tmp_path / "a.TIF")
+        _make_image(tmp_path / ".b.jpg")
+        (tmp_path / "album.jpg").mkdir()
+        _make_image(tmp_path / "album.jpg" / "nested.jpg")
+
+        # Dotfiles are still listed, as Path.glob did
+        assert find_photos(tmp_path) == [tmp_path / ".b.jpg", tmp_path / "a.TIF"]
+
 
 class TestNeedsConversion:
     def test_tiff_always_needs_conversion(self, tmp_path):
@@ -142,7 +176,18 @@ class TestPrepareForAnalysis:
         prepare_for_analysis(src, dst)
 
         with Image.open(dst) as img:
-            assert max(img.size) <= 2048
+            assert max(img.size) <= 1568
+
+    def test_resizes_large_jpeg_to_exact_edge(self, tmp_path):
+        """Oversized JPEGs are draft-decoded at reduced scale, then resized to MAX_EDGE."""
+        src = tmp_path / "big.jpg"
+        dst = tmp_path / "small.jpg"
+        _make_image(src, size=(6000, 4000))
+
+        prepare_for_analysis(src, dst)
+
+        with Image.open(dst) as img:
+            assert img.size == (1568, 1045)
 
     def test_preserves_small_image(self, tmp_path):
         """Should not resize images already under MAX_EDGE."""
@@ -155,7 +200,7 @@ class TestPrepareForAnalysis:
         with Image.open(dst) as img:
             # Dimensions may differ slightly due to JPEG re-encoding,
             # but should not be resized down
-            assert max(img.size) <= 2048
+            assert max(img.size) <= 1568
             assert max(img.size) >= 1000  # not aggressively resized
 
     def test_creates_parent_dirs(self, tmp_path):
@@ -167,3 +212,26 @@ class TestPrepareForAnalysis:
         prepare_for_analysis(src, dst)
 
         assert dst.exists()
+
+
+class TestHashAndPrepare:
+    def test_hash_matches_and_jpeg_written(self, tmp_path):
+        """One read yields the file's hash and a resized JPEG."""
+        src = tmp_path / "scan.tif"
+        dst = tmp_path / "out" / "scan.jpg"
+        _make_image(src, size=(3000, 2000))
+
+        sha = hash_and_prepare(src, dst)
+
+        assert sha == sha256_file(src)
+        with Image.open(dst) as img:
+            assert img.format == "JPEG"
+            assert max(img.size) == 1568
+
+    def test_empty_file_raises_os_error(self, tmp_path):
+        """A zero-byte scan fails as an unreadable image, like any other bad file."""
+        src = tmp_path / "empty.tif"
+        src.write_bytes(b"")
+
+        with pytest.raises(OSError):
+            hash_and_prepare(src, tmp_path / "out.jpg")
@@ -0,0 +1,39 @@
+"""Tests for discover.py: photo directory walking."""
+
+import os
+
+from PIL import Image
+
+from src.discover import find_photo_dirs
+
+
+def _make_photo(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", (10, 10), color="red").save(path, "JPEG")
+
+
+class TestFindPhotoDirs:
+    def test_finds_nested_photo_dirs_and_applies_excludes(self, tmp_path):
+        _make_photo(tmp_path / "1978" / "a.jpg")
+        _make_photo(tmp_path / "1978" / "beach" / "b.JPEG")
+        _make_photo(tmp_path / "_ai-layer" / "c.jpg")
+        (tmp_path / "empty").mkdir()
+
+        assert find_photo_dirs(tmp_path) == [tmp_path / "1978", tmp_path / "1978" / "beach"]
+
+    def test_skips_symlinked_and_unreadable_dirs(self, tmp_path, monkeypatch):
+        """Like rglob, symlinks aren't followed (no loops) and locked folders are skipped."""
+        _make_photo(tmp_path / "album" / "a.jpg")
+        _make_photo(tmp_path / "locked" / "b.jpg")
+        (tmp_path / "album" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if str(path) == str(tmp_path / "locked"):
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", scandir)
+
+        assert find_photo_dirs(tmp_path) == [tmp_path / "album"]
@@ -0,0 +1,83 @@
+"""Tests for doc_manifest.py: processed-hash index, cached run status summaries."""
+
+import json
+import os
+
+import src.config as config
+from src.doc_manifest import get_processed_hashes, processed_index_path, run_dir, status_summary, write_manifest
+
+
+def _write(sha, doc_type, pages):
+    return write_manifest(
+        "run1", f"{sha}.pdf", sha * 64, 100, pages,
+        extraction={"method": "pypdf"}, analysis={"document_type": doc_type},
+    )
+
+
+class TestProcessedHashes:
+    def test_index_built_then_appended(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path)
+        _write("a", "letter", 1)
+        assert not processed_index_path("run1").exists()
+
+        assert get_processed_hashes("run1") == {"a" * 64}
+        _write("b", "letter", 1)
+
+        assert processed_index_path("run1").read_text().split() == ["a" * 64, "b" * 64]
+        assert get_processed_hashes("run1") == {"a" * 64, "b" * 64}
+
+    def test_stale_index_is_rebuilt(self, tmp_path, monkeypatch):
+        """A deleted manifest is noticed even when coarse mtimes make the index look newer."""
+        monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path)
+        first = _write("a", "letter", 1)
+        _write("b", "letter", 1)
+        get_processed_hashes("run1")
+
+        first.unlink()
+        index = processed_index_path("run1")
+        future = run_dir("run1").stat().st_mtime_ns + 1_000_000_000
+        os.utime(index, ns=(future, future))
+
+        assert get_processed_hashes("run1") == {"b" * 64}
+        assert index.read_text().split() == ["b" * 64]
+
+    def test_empty_run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path)
+        assert get_processed_hashes("run1") == set()
+        assert not processed_index_path("run1").exists()
+
+
+class TestStatusSummary:
+    def test_aggregates_pages_and_types(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path)
+        _write("a", "letter", 2)
+        _write("b", "letter", 3)
+        _write("c", "receipt", 1)
+
+        summary = status_summary("run1")
+
+        assert summary == {
+            "manifests": 3,
+            "total_pages": 6,
+            "doc_types": {"letter": 2, "receipt": 1},
+        }
+
+    def test_picks_up_new_and_removed_manifests(self, tmp_path, monkeypatch):
+        """The sidecar is refreshed when manifests are added or deleted."""
+        monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path)
+        first = _write("a", "letter", 2)
+        status_summary("run1")
+        sidecar = tmp_path / "runs" / "run1" / "status_summary.json"
+        assert list(json.loads(sidecar.read_text())) == [first.name]
+
+        _write("b", "receipt", 4)
+        first.unlink()
+        summary = status_summary("run1")
+
+        assert summary == {"manifests": 1, "total_pages": 4, "doc_types": {"receipt": 1}}
+        assert list(json.loads(sidecar.read_text())) == ["bbbbbbbbbbbb.json"]
+
+    def test_empty_run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path)
+        assert not run_dir("run1").exists()
+        assert status_summary("run1") == {"manifests": 0, "total_pages": 0, "doc_types": {}}
@@ -1,24 +1,134 @@
-"""Tests for immich.py: date_estimate_to_iso."""
+"""Tests for immich.py: date_estimate_to_iso, asset name lookup, bulk asset updates, people stats, shared client."""
 
-from src.immich import date_estimate_to_iso
+import json
+
+import httpx
+import pytest
+
+import src.immich as immich
+from src.immich import build_name_lookup, date_estimate_to_iso, get_people_statistics, update_assets_bulk
 
 
 class TestDateEstimateToIso:
-    def test_year_only(self):
-        assert date_estimate_to_iso("1978") == "1978-01-01T00:00:00.000Z"
+    @pytest.mark.parametrize(
+        ("estimate", "expected"),
+        [
+            ("1978", "1978-01-01T00:00:00.000Z"),
+            ("1978-06", "1978-06-01T00:00:00.000Z"),
+            ("1978-06-15", "1978-06-15T00:00:00.000Z"),
+            ("2023-12-25", "2023-12-25T00:00:00.000Z"),
+            # Single-digit months pass through as-is (no zero-padding added)
+            ("1978-3", "1978-3-01T00:00:00.000Z"),
+        ],
+    )
+    def test_iso(self, estimate, expected):
+        assert date_estimate_to_iso(estimate) == expected
+
+
+class TestBuildNameLookup:
+    def test_maps_file_name_to_asset(self):
+        assets = [
+            {"id": "a1", "originalPath": "/photos/2009/1978/scan_001.tif"},
+            {"id": "a2", "originalPath": "/photos/2009/1978/scan_002.tif"},
+        ]
+        assert build_name_lookup(assets) == {"scan_001.tif": "a1", "scan_002.tif": "a2"}
+
+    def test_first_asset_wins_on_duplicate_names(self):
+        assets = [
+            {"id": "a1", "originalPath": "/photos/album-a/scan.tif"},
+            {"id": "a2", "originalPath": "/photos/album-b/scan.tif"},
+        ]
+        assert build_name_lookup(assets) == {"scan.tif": "a1"}
+
+    def test_no_suffix_matches(self):
+        """A name only matches whole file names, not names that merely end with it."""
+        lookup = build_name_lookup([{"id": "a1", "originalPath": "/photos/oldscan.tif"}])
+        assert lookup.get("scan.tif") is None
+
+
+class TestUpdateAssetsBulk:
+    def _client(self, handler):
+        return httpx.Client(base_url="http://immich.test/api", transport=httpx.MockTransport(handler))
+
+    def test_groups_identical_updates(self):
+        """Assets with identical field values should share one PUT /assets request."""
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(204)
+
+        failures = update_assets_bulk(self._client(handler), [
+            ("a1", "1978-01-01T00:00:00.000Z", None),
+            ("a2", "1978-01-01T00:00:00.000Z", None),
+            ("a3", "1980-01-01T00:00:00.000Z", "A photo"),
+        ])
+
+        assert failures == {}
+        assert len(bodies) == 2
+        by_date = {b["dateTimeOriginal"]: b for b in bodies}
+        assert sorted(by_date["1978-01-01T00:00:00.000Z"]["ids"]) == ["a1", "a2"]
+        assert by_date["1980-01-01T00:00:00.000Z"] == {
+            "ids": ["a3"],
+            "dateTimeOriginal": "1980-01-01T00:00:00.000Z",
+            "description": "A photo",
+        }
+
+    def test_last_update_per_asset_wins(self):
+        """An asset listed twice is sent once, with its last values, never in two racing requests."""
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(204)
+
+        failures = update_assets_bulk(self._client(handler), [
+            ("a1", "1978-01-01T00:00:00.000Z", "first"),
+            ("a2", "1978-01-01T00:00:00.000Z", "first"),
+            ("a1", "1980-01-01T00:00:00.000Z", "second"),
+        ])
+
+        assert failures == {}
+        assert sorted(body["ids"] for body in bodies) == [["a1"], ["a2"]]
+        assert {body["ids"][0]: body["description"] for body in bodies} == {"a1": "second", "a2": "first"}
+
+    def test_reports_failed_assets(self):
+        """A rejected request should be reported for every asset in its group."""
+        def handler(request):
+            body = json.loads(request.content)
+            return httpx.Response(400 if "bad" in body["ids"] else 204)
+
+        failures = update_assets_bulk(self._client(handler), [
+            ("ok", None, "fine"),
+            ("bad", None, "broken"),
+        ])
+
+        assert set(failures) == {"bad"}
+        assert isinstance(failures["bad"], httpx.HTTPStatusError)
+
+
+class TestGetPeopleStatistics:
+    def test_fetches_each_person(self):
+        def handler(request):
+            pid = request.url.path.split("/")[-2]
+            return httpx.Response(200, json={"assets": len(pid)})
+
+        client = httpx.Client(base_url="http://immich.test/api", transport=httpx.MockTransport(handler))
+        stats = get_people_statistics(client, ["p1", "p22", "p333"])
+
+        assert stats == {"p1": {"assets": 2}, "p22": {"assets": 3}, "p333": {"assets": 4}}
 
-    def test_year_month(self):
-        assert date_estimate_to_iso("1978-06") == "1978-06-01T00:00:00.000Z"
+    def test_no_people(self):
+        assert get_people_statistics(None, []) == {}
 
-    def test_full_date(self):
-        assert date_estimate_to_iso("1978-06-15") == "1978-06-15T00:00:00.000Z"
 
-    def test_year_month_day_format(self):
-        """Ensure the output always ends with T00:00:00.000Z."""
-        result = date_estimate_to_iso("2023-12-25")
-        assert result.endswith("T00:00:00.000Z")
+class TestSharedClient:
+    def test_reused_until_closed(self, monkeypatch):
+        monkeypatch.setattr(immich, "_shared_client", None)
+        first = immich._client()
+        assert immich._client() is first
 
-    def test_single_digit_month(self):
-        """Months like '3' should pass through as-is (no zero-padding added)."""
-        result = date_estimate_to_iso("1978-3")
-        assert result == "1978-3-01T00:00:00.000Z"
+        first.close()
+        second = immich._client()
+        assert second is not first
+        second.close()
@@ -1,8 +1,8 @@
 """Tests for manifest.py: write + load round-trip, atomic writes."""
 
-import json
+from pydantic_core import from_json
 
-from src.manifest import load_manifest, write_manifest
+from src.manifest import load_manifest, processed_manifest_names, update_manifest, write_manifest
 from src.models import InferenceMetadata, PhotoAnalysis, PhotoManifest
 
 # Patch the AI_LAYER_DIR to use tmp_path for tests
@@ -11,7 +11,7 @@ import src.config as config
 
 class TestManifestRoundTrip:
     def test_write_and_load(self, tmp_path, monkeypatch):
-        """Write a manifest and load it back — fields should survive round-trip."""
+        """One write: run dir created, no temp files left, fields survive the round-trip."""
         monkeypatch.setattr(config, "AI_LAYER_DIR", tmp_path)
 
         analysis = PhotoAnalysis(
@@ -37,8 +37,13 @@ class TestManifestRoundTrip:
             inference=inference,
         )
 
+        run_dir = tmp_path / "runs" / "20250115T103000Z" / "manifests"
+        assert path == run_dir / "abcdef123456.json"
         assert path.exists()
-        assert path.name == "abcdef123456.json"
+        assert list(run_dir.glob("*.tmp")) == []
+
+        data = from_json(path.read_bytes())
+        assert data["inference"]["timestamp"]  # present and not empty
 
         loaded = load_manifest(path)
         assert isinstance(loaded, PhotoManifest)
@@ -48,55 +53,44 @@ class TestManifestRoundTrip:
         assert loaded.inference.model == "claude-sonnet-4-20250514"
         assert loaded.inference.raw_response == '{"date_estimate": "1978-06"}'
 
-    def test_write_creates_directory(self, tmp_path, monkeypatch):
-        """write_manifest should create the run directory if it doesn't exist."""
-        monkeypatch.setattr(config, "AI_LAYER_DIR", tmp_path)
-
-        analysis = PhotoAnalysis(date_estimate="1980")
-        inference = InferenceMetadata(model="test")
-
-        path = write_manifest(
-            run_id="20250115T120000Z",
-            source_file_rel="test.tif",
-            source_sha256="a" * 64,
-            analysis=analysis,
-            inference=inference,
-        )
-
-        assert path.exists()
-        assert "20250115T120000Z" in str(path)
 
-    def test_atomic_write_no_temp_files(self, tmp_path, monkeypatch):
-        """After a successful write, no .tmp files should remain."""
+class TestProcessedManifestNames:
+    def test_collects_names_across_runs(self, tmp_path, monkeypatch):
+        """Manifest filenames from every run should be returned as one set."""
         monkeypatch.setattr(config, "AI_LAYER_DIR", tmp_path)
-
-        analysis = PhotoAnalysis()
-        inference = InferenceMetadata()
-
-        write_manifest(
-            run_id="20250115T130000Z",
-            source_file_rel="test.tif",
-            source_sha256="b" * 64,
-            analysis=analysis,
-            inference=inference,
-        )
-
-        run_dir = tmp_path / "runs" / "20250115T130000Z" / "manifests"
-        tmp_files = list(run_dir.glob("*.tmp"))
-        assert tmp_files == []
-
-    def test_manifest_has_timestamp(self, tmp_path, monkeypatch):
-        """Written manifest should have an inference timestamp."""
+        for run_id, sha in (("run-a", "a" * 64), ("run-b", "b" * 64)):
+            write_manifest(
+                run_id=run_id,
+                source_file_rel="test.tif",
+                source_sha256=sha,
+                analysis=PhotoAnalysis(),
+                inference=InferenceMetadata(),
+            )
+        (tmp_path / "runs" / "run-c").mkdir()  # run without manifests
+
+        assert processed_manifest_names() == {"aaaaaaaaaaaa.json", "bbbbbbbbbbbb.json"}
+
+    def test_missing_runs_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "AI_LAYER_DIR", tmp_path / "nope")
+        assert processed_manifest_names() == set()
+
+
+class TestLoadManifestCache:
+    def test_reload_after_update(self, tmp_path, monkeypatch):
+        """Cached manifests should be re-read once the file changes on disk."""
         monkeypatch.setattr(config, "AI_LAYER_DIR", tmp_path)
-
         path = write_manifest(
-            run_id="20250115T140000Z",
+            run_id="20250115T150000Z",
             source_file_rel="test.tif",
-            source_sha256="c" * 64,
-            analysis=PhotoAnalysis(),
+            source_sha256="d" * 64,
+            analysis=PhotoAnalysis(date_estimate="1980"),
             inference=InferenceMetadata(),
         )
 
-        data = json.loads(path.read_text())
-        assert "timestamp" in data["inference"]
-        assert data["inference"]["timestamp"]  # not empty
+        first = load_manifest(path)
+        assert load_manifest(path) is first
+        assert first.rotation == 0
+
+        update_manifest("20250115T150000Z", "d" * 12, {"rotation": 90})
+
+        assert load_manifest(path).rotation == 90
@@ -1,9 +1,8 @@
 """Tests for Pydantic models: validation, defaults, serialization."""
 
-import json
-
 import pytest
 from pydantic import ValidationError
+from pydantic_core import to_json
 
 from src.models import (
     DocumentAnalysis,
@@ -46,7 +45,7 @@ class TestPhotoAnalysis:
 
     def test_null_string_via_json(self):
         """Same null coercion should work via model_validate_json (the batch path)."""
-        data = json.dumps({"people_notes": None, "description_en": "A photo"})
+        data = to_json({"people_notes": None, "description_en": "A photo"})
         pa = PhotoAnalysis.model_validate_json(data)
         assert pa.people_notes == ""
         assert pa.description_en == "A photo"
@@ -68,9 +67,8 @@ class TestPhotoAnalysis:
         assert pa == pa2
 
     def test_json_round_trip(self, sample_photo_json):
-        """Validate from JSON string and back."""
-        json_str = json.dumps(sample_photo_json)
-        pa = PhotoAnalysis.model_validate_json(json_str)
+        """Validate from JSON bytes and back."""
+        pa = PhotoAnalysis.model_validate_json(to_json(sample_photo_json))
         assert pa.date_estimate == "1978-06"
         json_out = pa.model_dump_json()
         pa2 = PhotoAnalysis.model_validate_json(json_out)
@@ -23,3 +23,18 @@ def test_load_registry_returns_empty_when_missing(tmp_path, monkeypatch):
 
     registry = people.load_registry()
     assert len(registry.people) == 0
+
+
+def test_add_people_bulk_shares_timestamp():
+    registry = PeopleRegistry()
+    added = people.add_people_bulk(registry, [
+        {"name_en": "Alice", "immich_person_ids": ["c1"]},
+        {"name_en": "", "notes": "unnamed cluster"},
+    ])
+
+    assert registry.people == added
+    assert [p.name_en for p in added] == ["Alice", ""]
+    assert added[0].immich_person_ids == ["c1"]
+    assert added[1].immich_person_ids == []
+    assert added[0].person_id != added[1].person_id
+    assert added[0].created_at == added[1].created_at == added[1].updated_at
@@ -1,23 +1,50 @@
-"""Tests for run_batch: run-scoped workspaces and cleanup tolerance."""
+"""Tests for pipeline.py: photo slice workspaces, automated document extraction."""
+
+import os
+import threading
 
 from PIL import Image
+from pypdf import PdfWriter
+from pypdf.generic import ContentStream, DictionaryObject, NameObject
 
 import src.config as config
-from src.pipeline import process_slice
+import src.pipeline as pipeline
+from src.convert import sha256_file
+from src.doc_extract_text import ExtractionResult
+from src.doc_manifest import list_manifests as list_doc_manifests
+from src.manifest import load_manifest, write_manifest
+from src.models import DocumentAnalysis, DocumentInferenceMetadata, InferenceMetadata, PhotoAnalysis
+from src.pipeline import _auto_extract, _push_to_immich, _scan_pdfs, process_slice
 
 
-def test_process_slice_uses_run_scoped_workspace_and_tolerates_cleanup_errors(tmp_path, monkeypatch):
-    """Per-run workspaces avoid collisions, and cleanup failures should not abort the slice result."""
+_COLORS = ["red", "green", "blue", "yellow"]
+
+
+def _photo_slice(tmp_path, monkeypatch, names):
+    """Create an album of distinct photos and point the pipeline's paths and find_photos at it."""
     album_dir = tmp_path / "album"
     album_dir.mkdir()
-    src = album_dir / "scan.jpeg"
-    Image.new("RGB", (100, 100), color="blue").save(src, "JPEG")
+    sources = []
+    for name, color in zip(names, _COLORS):
+        src = album_dir / name
+        Image.new("RGB", (64, 48), color=color).save(src, "TIFF" if name.endswith(".tif") else "JPEG")
+        sources.append(src)
 
     monkeypatch.setattr(config, "DATA_DIR", tmp_path)
     monkeypatch.setattr(config, "MEDIA_ROOT", tmp_path)
     monkeypatch.setattr(config, "AI_LAYER_DIR", tmp_path / "photos")
     monkeypatch.setattr(config, "WORKSPACE_DIR", tmp_path / "workspace-root")
-    monkeypatch.setattr("src.pipeline.find_photos", lambda _: [src])
+    monkeypatch.setattr("src.pipeline.find_photos", lambda _: sources)
+    return album_dir, sources
+
+
+def _fake_result(*args):
+    return PhotoAnalysis(date_estimate="1980"), InferenceMetadata(model="m", prompt_version="v")
+
+
+def test_process_slice_uses_run_scoped_workspace_and_tolerates_cleanup_errors(tmp_path, monkeypatch):
+    """Per-run workspaces avoid collisions, and cleanup failures should not abort the slice result."""
+    album_dir, _ = _photo_slice(tmp_path, monkeypatch, ["scan.jpeg"])
     monkeypatch.setattr("src.pipeline.needs_conversion", lambda _: False)
 
     captured = {}
@@ -46,3 +73,275 @@ def test_process_slice_uses_run_scoped_workspace_and_tolerates_cleanup_errors(tm
     assert "20260304T000000Z" in str(captured["copied_to"].parent)
     assert result["failed"] == 1
     assert result["succeeded"] == 0
+
+
+def test_process_slice_prepares_photos_concurrently_in_source_order(tmp_path, monkeypatch):
+    """Preparation runs on a pool, but photos are analyzed in find_photos order."""
+    album_dir, _ = _photo_slice(tmp_path, monkeypatch, ["c.jpg", "a.tif", "b.jpeg"])
+
+    seen = []
+
+    def fake_analyze(jpeg_path, folder_hint):
+        assert jpeg_path.exists()
+        seen.append(jpeg_path.name)
+        raise RuntimeError("offline")
+
+    monkeypatch.setattr("src.pipeline.analyze_photo", fake_analyze)
+
+    result = process_slice("album", album_dir, "20260304T000000Z", budget_remaining=3600, push=False)
+
+    assert seen == ["c.jpg", "a.jpg", "b.jpg"]
+    assert result["failed"] == 3
+
+
+def test_process_slice_skips_cached_processed_photos_without_preparing(tmp_path, monkeypatch):
+    """On a rerun, unchanged photos with manifests are skipped before hashing or conversion."""
+    album_dir, _ = _photo_slice(tmp_path, monkeypatch, ["scan.tif"])
+    monkeypatch.setattr("src.pipeline.analyze_photo", _fake_result)
+
+    first = process_slice("album", album_dir, "20260304T000000Z", budget_remaining=3600, push=False)
+    assert first["succeeded"] == 1
+
+    monkeypatch.setattr("src.pipeline._prepare_photo", lambda *a: (_ for _ in ()).throw(AssertionError("prepared")))
+    second = process_slice("album", album_dir, "20260305T000000Z", budget_remaining=3600, push=False)
+
+    assert second["succeeded"] == 0
+    assert second["photos_considered"] == 1
+
+
+def test_process_slice_analyzes_photos_concurrently(tmp_path, monkeypatch):
+    """With max_workers > 1, analyses overlap and every result gets a manifest."""
+    album_dir, _ = _photo_slice(tmp_path, monkeypatch, ["a.jpg", "b.jpg", "c.jpg"])
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_analyze(jpeg_path, folder_hint):
+        barrier.wait()
+        return _fake_result()
+
+    monkeypatch.setattr("src.pipeline.analyze_photo", fake_analyze)
+
+    result = process_slice("album", album_dir, "20260304T000000Z", budget_remaining=3600,
+                           push=False, max_workers=3)
+
+    assert result["succeeded"] == 3
+    assert result["budget_exhausted"] is False
+    assert len(list((tmp_path / "photos" / "runs" / "20260304T000000Z" / "manifests").glob("*.json"))) == 3
+
+
+def test_process_slice_overlaps_preparation_and_analysis(tmp_path, monkeypatch):
+    """The first photo is analyzed while later photos are still being prepared."""
+    album_dir, _ = _photo_slice(tmp_path, monkeypatch, ["a.jpg", "b.jpg"])
+    first_analyzed = threading.Event()
+    real_prepare = pipeline._prepare_photo
+
+    def slow_prepare(src, workspace):
+        if src.name == "b.jpg":
+            assert first_analyzed.wait(timeout=5), "analysis did not start before prep finished"
+        return real_prepare(src, workspace)
+
+    def fake_analyze(jpeg_path, folder_hint):
+        first_analyzed.set()
+        return _fake_result()
+
+    monkeypatch.setattr("src.pipeline._prepare_photo", slow_prepare)
+    monkeypatch.setattr("src.pipeline.analyze_photo", fake_analyze)
+
+    result = process_slice("album", album_dir, "20260304T000000Z", budget_remaining=3600, push=False)
+
+    assert result["succeeded"] == 2
+
+
+def test_process_slice_counts_prepare_failures_and_keeps_going(tmp_path, monkeypatch):
+    """A photo that fails to prepare is counted as failed; the rest of the slice still gets manifests."""
+    album_dir, sources = _photo_slice(tmp_path, monkeypatch, ["a.jpg", "b.tif", "c.jpg"])
+    sources[1].write_bytes(b"not a tiff")
+    monkeypatch.setattr("src.pipeline.analyze_photo", _fake_result)
+
+    result = process_slice("album", album_dir, "20260304T000000Z", budget_remaining=3600,
+                           push=False, max_workers=2)
+
+    assert result["succeeded"] == 2
+    assert result["failed"] == 1
+    assert len(list((tmp_path / "photos" / "runs" / "20260304T000000Z" / "manifests").glob("*.json"))) == 2
+
+
+def test_process_slice_push_includes_manifests_from_before_resume(tmp_path, monkeypatch):
+    """On --resume, photos analyzed before the interruption are pushed with the rest of the slice only."""
+    album_dir, sources = _photo_slice(tmp_path, monkeypatch, ["a.jpg", "b.jpg"])
+    run_id = "20260304T000000Z"
+    write_manifest(run_id, "album/a.jpg", sha256_file(sources[0]), *_fake_result())
+    write_manifest(run_id, "other/x.jpg", "f" * 64, *_fake_result())
+    analyzed = []
+
+    def fake_analyze(jpeg_path, folder_hint):
+        analyzed.append(jpeg_path.name)
+        return _fake_result()
+
+    monkeypatch.setattr("src.pipeline.analyze_photo", fake_analyze)
+    monkeypatch.setattr("src.pipeline.load_manifest", lambda p: (_ for _ in ()).throw(AssertionError("parsed")))
+    monkeypatch.setattr(config, "validate_immich_config", lambda: [])
+    pushed = {}
+    monkeypatch.setattr("src.pipeline._push_to_immich",
+                        lambda run_id, slice_path, manifests: pushed.update(slice_path=slice_path, manifests=manifests))
+
+    result = process_slice("album", album_dir, run_id, budget_remaining=3600, push=True)
+
+    assert analyzed == ["b.jpg"]
+    assert result["succeeded"] == 1
+    assert pushed["slice_path"] == "album"
+    assert sorted(load_manifest(p).source_file for p in pushed["manifests"]) == ["album/a.jpg", "album/b.jpg"]
+
+
+def test_push_to_immich_matches_manifests_and_buckets_confidence(tmp_path, monkeypatch):
+    """Manifests are loaded, matched by file name, updated in bulk and bucketed into review albums."""
+    monkeypatch.setattr(config, "AI_LAYER_DIR", tmp_path)
+    paths = [
+        write_manifest("run1", f"album/{name}", sha * 64,
+                       PhotoAnalysis(date_estimate="1980", date_confidence=conf, description_en=name),
+                       InferenceMetadata(model="m", prompt_version="v"))
+        for name, sha, conf in [("a.tif", "a", 0.9), ("b.tif", "b", 0.3), ("c.tif", "c", 0.5)]
+    ]
+    monkeypatch.setattr("src.pipeline.immich_client", lambda: None)
+    monkeypatch.setattr("src.pipeline.search_assets_by_path", lambda client, prefix: [
+        {"id": "id-a", "originalPath": "/lib/album/a.tif"},
+        {"id": "id-b", "originalPath": "/lib/album/b.tif"},
+    ])
+    sent = {}
+    monkeypatch.setattr("src.pipeline.update_assets_bulk", lambda client, updates: sent.update(updates=updates) or {})
+    albums = {}
+    monkeypatch.setattr("src.pipeline.create_album",
+                        lambda client, name, description, asset_ids: albums.update({name.split(" (")[0]: asset_ids}))
+
+    result = _push_to_immich("run1", slice_path="album", manifests=paths)
+
+    assert result == {"matched": 2, "updated": 2, "skipped": 1}
+    assert [u[0] for u in sent["updates"]] == ["id-a", "id-b"]
+    assert albums == {"Low Confidence": ["id-b"]}
+
+
+_HELVETICA = DictionaryObject({
+    NameObject("/Type"): NameObject("/Font"),
+    NameObject("/Subtype"): NameObject("/Type1"),
+    NameObject("/BaseFont"): NameObject("/Helvetica"),
+})
+
+
+def _doc_work(tmp_path, names, with_text=False):
+    """One-page PDFs plus their work-list entries; blank pages unless with_text."""
+    work = []
+    for name in names:
+        pdf = tmp_path / name
+        writer = PdfWriter()
+        page = writer.add_blank_page(width=200, height=72)
+        if with_text:
+            page[NameObject("/Resources")] = DictionaryObject({
+                NameObject("/Font"): DictionaryObject({NameObject("/F1"): _HELVETICA}),
+            })
+            content = ContentStream(None, None)
+            content.set_data(f"BT /F1 12 Tf 10 30 Td (Text of {name}) Tj ET".encode())
+            page.replace_contents(content)
+        with open(pdf, "wb") as f:
+            writer.write(f)
+        work.append({
+            "path": pdf,
+            "rel_path": name,
+            "sha256": name[0] * 64,
+            "file_size_bytes": pdf.stat().st_size,
+            "page_count": 1,
+        })
+    return work
+
+
+def test_auto_extract_writes_manifests_and_records_failures(tmp_path, monkeypatch):
+    """Each document is extracted, analyzed, and written; failures don't stop the run."""
+    monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path / "documents")
+    monkeypatch.setattr(
+        "src.pipeline.extract_text",
+        lambda path: ExtractionResult(total_pages=1, page_texts=[f"text of {path.name}"], chars_extracted=12),
+    )
+
+    def fake_analyze(text, source_file, page_count):
+        if source_file == "bad.pdf":
+            raise RuntimeError("model refused")
+        return DocumentAnalysis(document_type="letter", title=source_file), DocumentInferenceMetadata(
+            input_tokens=10, output_tokens=5,
+        )
+
+    monkeypatch.setattr("src.pipeline.analyze_document", fake_analyze)
+    work = _doc_work(tmp_path, ["a.pdf", "bad.pdf", "c.pdf"])
+
+    rc = _auto_extract("run1", work, batch_size=0, pacing_delay=0)
+
+    assert rc == 1
+    assert [p.name for p in list_doc_manifests("run1")] == ["aaaaaaaaaaaa.json", "cccccccccccc.json"]
+    meta = (tmp_path / "documents" / "runs" / "run1" / "run_meta.json").read_text()
+    assert '"succeeded": 2' in meta
+    assert "model refused" in meta
+    assert '"transient": false' in meta
+
+
+def test_auto_extract_parallel_workers(tmp_path, monkeypatch):
+    """With workers > 1, text comes from the spawned extraction pool and every document gets a manifest."""
+    monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path / "documents")
+    seen = {}
+
+    def fake_analyze(text, source_file, page_count):
+        seen[source_file] = text
+        return DocumentAnalysis(document_type="letter", title=source_file), DocumentInferenceMetadata(
+            input_tokens=10, output_tokens=5,
+        )
+
+    monkeypatch.setattr("src.pipeline.analyze_document", fake_analyze)
+    work = _doc_work(tmp_path, ["a.pdf", "b.pdf", "c.pdf"], with_text=True)
+
+    rc = _auto_extract("run2", work, batch_size=0, pacing_delay=0, max_workers=2)
+
+    assert rc == 0
+    assert {name: "Text of " + name in text for name, text in seen.items()} == {
+        "a.pdf": True, "b.pdf": True, "c.pdf": True,
+    }
+    assert [p.name for p in list_doc_manifests("run2")] == [
+        "aaaaaaaaaaaa.json", "bbbbbbbbbbbb.json", "cccccccccccc.json",
+    ]
+    meta = (tmp_path / "documents" / "runs" / "run2" / "run_meta.json").read_text()
+    assert '"succeeded": 3' in meta
+    assert '"skipped": 0' in meta
+
+
+def test_scan_pdfs_reuses_cached_hash_and_page_count(tmp_path, monkeypatch):
+    """A rescan of unchanged PDFs reads neither file contents nor the page tree."""
+    monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path / "documents")
+    monkeypatch.setattr(config, "DOCUMENTS_ROOT", tmp_path)
+    _doc_work(tmp_path, ["a.pdf", "b.pdf"])
+
+    first = _scan_pdfs(tmp_path)
+    assert [d["page_count"] for d in first] == [1, 1]
+
+    def boom(*args, **kwargs):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr("src.pipeline.sha256_file", boom)
+    monkeypatch.setattr("src.pipeline.PdfReader", boom)
+
+    assert _scan_pdfs(tmp_path) == first
+
+
+def test_scan_pdfs_ignores_symlink_loops_and_unreadable_dirs(tmp_path, monkeypatch):
+    """Like rglob, the walk neither follows directory symlinks nor dies on a locked folder."""
+    monkeypatch.setattr(config, "DOC_AI_LAYER_DIR", tmp_path / "documents")
+    monkeypatch.setattr(config, "DOCUMENTS_ROOT", tmp_path)
+    _doc_work(tmp_path, ["a.pdf"])
+    (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+    (tmp_path / "locked").mkdir()
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if str(path) == str(tmp_path / "locked"):
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+
+    assert [d["rel_path"] for d in _scan_pdfs(tmp_path)] == ["a.pdf"]
+
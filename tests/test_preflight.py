@@ -0,0 +1,41 @@
+"""Tests for preflight.py: check ordering."""
+
+import logging
+import threading
+
+import src.config as config
+from src.preflight import run_preflight
+
+
+def test_nas_logs_live_and_immich_logs_after_slice(tmp_path, monkeypatch, caplog):
+    """NAS progress shows while Immich is still checking; Immich's messages come after the slice line."""
+    nas_logged = threading.Event()
+    seen_during_immich = []
+    log = logging.getLogger("living_archive")
+
+    def nas():
+        log.info("nas ok")
+        nas_logged.set()
+        return True
+
+    def immich():
+        # Still running when the NAS check logs, like a slow Immich ping
+        assert nas_logged.wait(timeout=5)
+        seen_during_immich.extend(r.getMessage() for r in caplog.records)
+        log.info("immich ok")
+        return True
+
+    monkeypatch.setattr("src.preflight.ensure_nas_mounted", nas)
+    monkeypatch.setattr("src.preflight.check_immich", immich)
+    monkeypatch.setattr("src.auth.resolve_token", lambda: "token")
+    monkeypatch.setattr(config, "SLICE_DIR", tmp_path)
+    monkeypatch.setattr(config, "PROMPT_FILE", tmp_path / "missing.txt")
+    monkeypatch.setattr(config, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(config, "FAMILY_CATALOG_DB", tmp_path / "catalog.db")
+
+    with caplog.at_level(logging.INFO, logger="living_archive"):
+        run_preflight()
+
+    assert "nas ok" in seen_during_immich
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages.index("nas ok") < messages.index(f"  Slice directory: {tmp_path}") < messages.index("immich ok")
@@ -0,0 +1,76 @@
+"""Tests for scan_cache.py: file walking, stat-keyed lookups and persistence."""
+
+import os
+
+from src.scan_cache import cached_entry, find_files, load_scan_cache, save_scan_cache, store_entry
+
+
+def test_find_files_recurses_and_skips_hidden(tmp_path):
+    (tmp_path / "b" / "deep").mkdir(parents=True)
+    for rel in ["a.pdf", "b/c.PDF", "b/deep/d.pdf", "b/.hidden.pdf", "b/notes.txt"]:
+        (tmp_path / rel).write_bytes(b"%PDF")
+
+    found = find_files(tmp_path, {".pdf"})
+
+    assert [p.relative_to(tmp_path).as_posix() for p, _ in found] == ["a.pdf", "b/c.PDF", "b/deep/d.pdf"]
+    assert all(st.st_size == 4 for _, st in found)
+
+
+def test_find_files_skips_symlinked_and_unreadable_dirs(tmp_path, monkeypatch):
+    """Directory symlinks aren't descended into (no loops); unlistable folders are skipped."""
+    (tmp_path / "a.pdf").write_bytes(b"%PDF")
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "b.pdf").write_bytes(b"%PDF")
+    (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+    (tmp_path / "link.pdf").symlink_to(tmp_path / "a.pdf")
+
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if str(path) == str(tmp_path / "locked"):
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+
+    found = find_files(tmp_path, {".pdf"})
+
+    assert [p.name for p, _ in found] == ["a.pdf", "link.pdf"]
+
+
+class TestScanCache:
+    def test_hit_while_file_unchanged(self, tmp_path):
+        f = tmp_path / "doc.pdf"
+        f.write_bytes(b"%PDF-1.4")
+        cache = {}
+        store_entry(cache, str(f), f.stat(), sha256="abc")
+
+        assert cached_entry(cache, str(f), f.stat())["sha256"] == "abc"
+
+    def test_miss_after_size_change(self, tmp_path):
+        f = tmp_path / "doc.pdf"
+        f.write_bytes(b"%PDF-1.4")
+        cache = {}
+        store_entry(cache, str(f), f.stat(), sha256="abc")
+        f.write_bytes(b"%PDF-1.4 edited")
+
+        assert cached_entry(cache, str(f), f.stat()) is None
+
+    def test_miss_for_unknown_path(self, tmp_path):
+        f = tmp_path / "doc.pdf"
+        f.write_bytes(b"")
+        assert cached_entry({}, str(f), f.stat()) is None
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "sub" / "sha_cache.json"
+        cache = {"/a.pdf": {"size": 1, "mtime_ns": 2, "sha256": "abc"}}
+        save_scan_cache(path, cache)
+
+        assert load_scan_cache(path) == cache
+        assert list(path.parent.glob("*.tmp")) == []
+
+    def test_missing_or_corrupt_file_is_empty(self, tmp_path):
+        assert load_scan_cache(tmp_path / "missing.json") == {}
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json")
+        assert load_scan_cache(corrupt) == {}